@@ -2,17 +2,17 @@
 """ALM Orchestrator - Jira + Claude Code + GitHub integration daemon."""
 
 import argparse
+import asyncio
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 
-from dotenv import load_dotenv
-
-from alm_orchestrator.config import Config, ConfigError
-from alm_orchestrator.daemon import Daemon
-
 
 # Default paths and settings
 DEFAULT_ENV_FILE = ".env"
@@ -27,6 +27,9 @@ LOG_DATEFMT_FILE = "%Y-%m-%d %H:%M:%S"
 LOG_FILE_PREFIX = "run-"
 LOG_FILE_EXTENSION = ".log"
 LOG_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+LOG_ROTATE_WHEN = "H"
+LOG_BACKUP_COUNT = 24
+LOG_BUFFER_CAPACITY = 1024  # records held before a batched write
 
 
 def setup_logging(verbose: bool = False, logs_dir: str = DEFAULT_LOGS_DIR) -> None:
@@ -56,18 +59,44 @@ def setup_logging(verbose: bool = False, logs_dir: str = DEFAULT_LOGS_DIR) -> No
     ))
     root_logger.addHandler(console_handler)
 
-    # File handler - CSV format, DEBUG level
-    file_handler = logging.FileHandler(log_file)
+    # File handler - CSV format, DEBUG level, rotated hourly
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        log_file,
+        when=LOG_ROTATE_WHEN,
+        backupCount=LOG_BACKUP_COUNT,
+    )
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(logging.Formatter(
         LOG_FORMAT_FILE,
         datefmt=LOG_DATEFMT_FILE
     ))
-    root_logger.addHandler(file_handler)
+
+    # Buffer file writes; errors flush immediately so failures are on disk
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True,
+    )
+    memory_handler.setLevel(logging.DEBUG)
+    atexit.register(memory_handler.flush)
+
+    # File I/O runs on a listener thread so action threads never block on disk
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setLevel(logging.DEBUG)
+    root_logger.addHandler(queue_handler)
+    listener = logging.handlers.QueueListener(
+        log_queue, memory_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Registered last so it runs first: drain the queue before the final flush
+    atexit.register(listener.stop)
 
     logging.info(f"Logging to: {log_file}")
 
 
+@functools.cache
 def get_prompts_dir() -> str:
     """Get path to prompts directory."""
     # Look relative to this file
@@ -90,6 +119,11 @@ def main() -> int:
         type=int,
         help="Override poll interval in seconds (default: from env or 30)",
     )
+    parser.add_argument(
+        "--webhook-port",
+        type=int,
+        help="Listen for Jira webhooks on this port (polling becomes a fallback)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -115,6 +149,12 @@ def main() -> int:
 
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors don't pay for the Jira,
+    # GitHub and dotenv imports
+    from dotenv import load_dotenv
+    from alm_orchestrator.config import Config, ConfigError
+    from alm_orchestrator.daemon import Daemon
+
     setup_logging(args.verbose, args.logs_dir)
     logger = logging.getLogger(__name__)
 
@@ -127,6 +167,10 @@ def main() -> int:
     if args.poll_interval:
         os.environ["POLL_INTERVAL_SECONDS"] = str(args.poll_interval)
 
+    # Override webhook port if specified
+    if args.webhook_port:
+        os.environ["WEBHOOK_PORT"] = str(args.webhook_port)
+
     try:
         config = Config.from_env()
     except ConfigError as e:
@@ -144,11 +188,12 @@ def main() -> int:
 
     if args.dry_run:
         logger.info("Dry run mode - polling once")
-        issues_found = daemon.poll_once()
+        issues_found = asyncio.run(daemon.poll_once())
+        daemon.close()
         logger.info(f"Found {issues_found} issues with AI labels")
         return 0
 
-    daemon.run()
+    asyncio.run(daemon.run())
     return 0
 
 
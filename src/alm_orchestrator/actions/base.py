@@ -13,6 +13,21 @@ AI_LABEL_PREFIX = "ai-"
 TEMPLATE_EXTENSION = ".md"
 
 
+def format_header(title: str) -> str:
+    """Format a comment header as a title underlined with '='.
+
+    Args:
+        title: The header text (e.g., "INVESTIGATION RESULTS").
+
+    Returns:
+        The title followed by a matching '=' underline.
+    """
+    return f"{title}\n{'=' * len(title)}"
+
+
+INVALID_ISSUE_TYPE_HEADER = format_header("INVALID ISSUE TYPE")
+
+
 class BaseAction(ABC):
     """Abstract base class for all AI actions.
 
@@ -80,7 +95,7 @@ class BaseAction(ABC):
 
         Args:
             issue: Jira issue object.
-            jira_client: JiraClient for posting comments and removing labels.
+            jira_client: JiraClient for posting the rejection and removing the label.
 
         Returns:
             True if valid (or no validation configured), False if rejected.
@@ -98,19 +113,14 @@ class BaseAction(ABC):
             f"Rejecting {issue.key}: {self.label} does not support issue type {issue_type}"
         )
 
-        # Post rejection comment
         allowed_str = ", ".join(allowed)
-        header = "INVALID ISSUE TYPE"
         comment = (
-            f"{header}\n"
-            f"{'=' * len(header)}\n\n"
+            f"{INVALID_ISSUE_TYPE_HEADER}\n\n"
             f"The {self.label} action only works on: {allowed_str}\n\n"
             f"This issue is a {issue_type}. "
             f"Please use an appropriate action for this issue type."
         )
-        jira_client.add_comment(issue.key, comment)
-
-        # Remove label
-        jira_client.remove_label(issue.key, self.label)
+        # Post rejection comment and remove label in one update
+        jira_client.update_issue(issue.key, comment=comment, remove_labels=[self.label])
 
         return False
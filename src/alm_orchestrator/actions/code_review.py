@@ -1,11 +1,16 @@
 """Code review action handler."""
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_header
+from alm_orchestrator.utils.changed_files import format_changed_files
 from alm_orchestrator.utils.pr_extraction import find_pr_in_texts
 
 LABEL_CODE_REVIEW = "ai-code-review"
+CODE_REVIEW_FAILED_HEADER = format_header("CODE REVIEW FAILED")
+CODE_REVIEW_HEADER = format_header("CODE REVIEW")
+CODE_REVIEW_COMPLETE_HEADER = format_header("CODE REVIEW COMPLETE")
 
 
 class CodeReviewAction(BaseAction):
@@ -40,33 +45,37 @@ class CodeReviewAction(BaseAction):
 
         # Fetch comments (sorted newest-first)
         comments = jira_client.get_comments(issue_key)
-        comment_bodies = [c["body"] for c in comments]
+        comment_bodies = (c["body"] for c in comments)
 
         # Search description first, then comments
         pr_number = find_pr_in_texts(description, comment_bodies)
 
         if not pr_number:
-            header = "CODE REVIEW FAILED"
-            jira_client.add_comment(
+            jira_client.update_issue(
                 issue_key,
-                f"{header}\n"
-                f"{'=' * len(header)}\n\n"
-                "Could not find PR number in issue description or comments. "
-                "Please include the PR URL or number."
+                comment=(
+                    f"{CODE_REVIEW_FAILED_HEADER}\n\n"
+                    "Could not find PR number in issue description or comments. "
+                    "Please include the PR URL or number."
+                ),
+                remove_labels=[self.label],
             )
-            jira_client.remove_label(issue_key, self.label)
             return f"No PR found for {issue_key}"
 
-        # Get PR info including head branch and changed files
-        pr_info = github_client.get_pr_info(pr_number)
+        # Get PR info including head branch and changed files, refreshing
+        # the clone cache in the background meanwhile
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            prefetch = pool.submit(github_client.prefetch_clone_cache)
+            pr_info = github_client.get_pr_info(pr_number)
+            prefetch.result()
         changed_files = pr_info["changed_files"]
 
         # Clone the PR's head branch to review the actual changes
         work_dir = github_client.clone_repo(branch=pr_info["head_branch"])
 
         try:
-            # Format changed files list for the prompt
-            changed_files_text = "\n".join(f"- {f}" for f in changed_files)
+            # Format changed files list for the prompt, rolled up if very long
+            changed_files_text = format_changed_files(changed_files)
 
             # Run Claude for code review (read-only tools)
             template_path = os.path.join(self._prompts_dir, "code_review.md")
@@ -83,20 +92,19 @@ class CodeReviewAction(BaseAction):
             )
 
             # Post review as PR comment
-            header = "CODE REVIEW"
-            comment = f"{header}\n{'=' * len(header)}\n\n{result.content}"
+            comment = f"{CODE_REVIEW_HEADER}\n\n{result.content}"
             github_client.add_pr_comment(pr_number, comment)
 
             # Notify in Jira
-            complete_header = "CODE REVIEW COMPLETE"
-            jira_client.add_comment(
+            jira_client.update_issue(
                 issue_key,
-                f"{complete_header}\n"
-                f"{'=' * len(complete_header)}\n\n"
-                f"Review posted to PR #{pr_number}"
-                f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
+                comment=(
+                    f"{CODE_REVIEW_COMPLETE_HEADER}\n\n"
+                    f"Review posted to PR #{pr_number}"
+                    f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
+                ),
+                remove_labels=[self.label],
             )
-            jira_client.remove_label(issue_key, self.label)
 
             return f"Code review complete for PR #{pr_number}"
 
@@ -2,12 +2,13 @@
 
 import logging
 import os
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_header
 
 logger = logging.getLogger(__name__)
 
 # Label and conventions for fixes
 LABEL_FIX = "ai-fix"
+FIX_CREATED_HEADER = format_header("FIX CREATED")
 BRANCH_PREFIX_FIX = "fix-"
 COMMIT_PREFIX_FIX = "fix: "
 
@@ -85,19 +86,14 @@ class FixAction(BaseAction):
                 )
             )
 
-            # Post PR link to Jira
-            header = "FIX CREATED"
+            # Post PR link to Jira and remove label
             comment = (
-                f"{header}\n"
-                f"{'=' * len(header)}\n\n"
+                f"{FIX_CREATED_HEADER}\n\n"
                 f"Pull Request: {pr.html_url}\n\n"
                 f"Review the changes and merge when ready."
                 f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
             )
-            jira_client.add_comment(issue_key, comment)
-
-            # Remove label
-            jira_client.remove_label(issue_key, self.label)
+            jira_client.update_issue(issue_key, comment=comment, remove_labels=[self.label])
 
             return f"Fix PR created for {issue_key}: {pr.html_url}"
 
@@ -1,9 +1,10 @@
 """Impact analysis action handler."""
 
 import os
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_header
 
 LABEL_IMPACT = "ai-impact"
+IMPACT_HEADER = format_header("IMPACT ANALYSIS")
 
 
 class ImpactAction(BaseAction):
@@ -52,13 +53,11 @@ class ImpactAction(BaseAction):
                 action="impact",
             )
 
-            header = "IMPACT ANALYSIS"
             comment = (
-                f"{header}\n{'=' * len(header)}\n\n{result.content}"
+                f"{IMPACT_HEADER}\n\n{result.content}"
                 f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
             )
-            jira_client.add_comment(issue_key, comment)
-            jira_client.remove_label(issue_key, self.label)
+            jira_client.update_issue(issue_key, comment=comment, remove_labels=[self.label])
 
             return f"Impact analysis complete for {issue_key}"
 
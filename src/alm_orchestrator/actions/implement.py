@@ -2,13 +2,15 @@
 
 import logging
 import os
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_header
 
 logger = logging.getLogger(__name__)
 
 
 # Label and conventions for features
 LABEL_IMPLEMENT = "ai-implement"
+INVALID_TICKET_HEADER = format_header("INVALID TICKET")
+IMPLEMENTATION_CREATED_HEADER = format_header("IMPLEMENTATION CREATED")
 BRANCH_PREFIX_FEATURE = "feature-"
 COMMIT_PREFIX_FEAT = "feat: "
 
@@ -72,10 +74,9 @@ class ImplementAction(BaseAction):
             # Check if Claude rejected the ticket as invalid/unsafe
             if self._is_invalid_ticket(result.content):
                 logger.warning(f"Invalid ticket rejected: {issue_key}")
-                header = "INVALID TICKET"
-                comment = f"{header}\n{'=' * len(header)}"
-                jira_client.add_comment(issue_key, comment)
-                jira_client.remove_label(issue_key, self.label)
+                jira_client.update_issue(
+                    issue_key, comment=INVALID_TICKET_HEADER, remove_labels=[self.label]
+                )
                 return f"Invalid ticket rejected for {issue_key}"
 
             commit_message = f"{COMMIT_PREFIX_FEAT}{summary}\n\nJira: {issue_key}"
@@ -94,16 +95,13 @@ class ImplementAction(BaseAction):
                 )
             )
 
-            header = "IMPLEMENTATION CREATED"
             comment = (
-                f"{header}\n"
-                f"{'=' * len(header)}\n\n"
+                f"{IMPLEMENTATION_CREATED_HEADER}\n\n"
                 f"Pull Request: {pr.html_url}\n\n"
                 f"Review the changes and merge when ready."
                 f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
             )
-            jira_client.add_comment(issue_key, comment)
-            jira_client.remove_label(issue_key, self.label)
+            jira_client.update_issue(issue_key, comment=comment, remove_labels=[self.label])
 
             return f"Feature PR created for {issue_key}: {pr.html_url}"
 
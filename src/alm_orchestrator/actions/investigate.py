@@ -1,9 +1,10 @@
 """Investigate action handler for root cause analysis."""
 
 import os
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_header
 
 LABEL_INVESTIGATE = "ai-investigate"
+INVESTIGATION_HEADER = format_header("INVESTIGATION RESULTS")
 
 
 class InvestigateAction(BaseAction):
@@ -54,16 +55,12 @@ class InvestigateAction(BaseAction):
                 action="investigate",
             )
 
-            # Post findings as Jira comment
-            header = "INVESTIGATION RESULTS"
+            # Post findings as Jira comment and remove the label to mark as processed
             comment = (
-                f"{header}\n{'=' * len(header)}\n\n{result.content}"
+                f"{INVESTIGATION_HEADER}\n\n{result.content}"
                 f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
             )
-            jira_client.add_comment(issue_key, comment)
-
-            # Remove the label to mark as processed
-            jira_client.remove_label(issue_key, self.label)
+            jira_client.update_issue(issue_key, comment=comment, remove_labels=[self.label])
 
             return f"Investigation complete for {issue_key}"
 
@@ -2,11 +2,12 @@
 
 import logging
 import os
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_header
 
 logger = logging.getLogger(__name__)
 
 LABEL_RECOMMEND = "ai-recommend"
+RECOMMENDATIONS_HEADER = format_header("RECOMMENDATIONS")
 
 
 class RecommendAction(BaseAction):
@@ -75,13 +76,11 @@ class RecommendAction(BaseAction):
                 action="recommend",
             )
 
-            header = "RECOMMENDATIONS"
             comment = (
-                f"{header}\n{'=' * len(header)}\n\n{result.content}"
+                f"{RECOMMENDATIONS_HEADER}\n\n{result.content}"
                 f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
             )
-            jira_client.add_comment(issue_key, comment)
-            jira_client.remove_label(issue_key, self.label)
+            jira_client.update_issue(issue_key, comment=comment, remove_labels=[self.label])
 
             return f"Recommendations posted for {issue_key}"
 
@@ -2,10 +2,20 @@
 
 import os
 
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_header
+from alm_orchestrator.utils.changed_files import format_changed_files
 from alm_orchestrator.utils.pr_extraction import find_pr_in_texts
 
 LABEL_SECURITY_REVIEW = "ai-security-review"
+SECURITY_REVIEW_FAILED_HEADER = format_header("SECURITY REVIEW FAILED")
+SECURITY_REVIEW_HEADER = format_header("SECURITY REVIEW")
+SECURITY_REVIEW_COMPLETE_HEADER = format_header("SECURITY REVIEW COMPLETE")
+SECURITY_REVIEW_SKIPPED_HEADER = format_header("SECURITY REVIEW SKIPPED")
+
+# Files that cannot carry executable changes; PRs touching only these are
+# not worth a clone and Claude run. Lockfiles, SVGs and .txt files (such as
+# requirements.txt and CMakeLists.txt) stay reviewable.
+NON_CODE_EXTENSIONS = (".md", ".rst", ".png", ".jpg", ".jpeg", ".gif")
 
 
 class SecurityReviewAction(BaseAction):
@@ -40,33 +50,46 @@ class SecurityReviewAction(BaseAction):
 
         # Fetch comments (sorted newest-first)
         comments = jira_client.get_comments(issue_key)
-        comment_bodies = [c["body"] for c in comments]
+        comment_bodies = (c["body"] for c in comments)
 
         # Search description first, then comments
         pr_number = find_pr_in_texts(description, comment_bodies)
 
         if not pr_number:
-            header = "SECURITY REVIEW FAILED"
-            jira_client.add_comment(
+            jira_client.update_issue(
                 issue_key,
-                f"{header}\n"
-                f"{'=' * len(header)}\n\n"
-                "Could not find PR number in issue description or comments. "
-                "Please include the PR URL or number."
+                comment=(
+                    f"{SECURITY_REVIEW_FAILED_HEADER}\n\n"
+                    "Could not find PR number in issue description or comments. "
+                    "Please include the PR URL or number."
+                ),
+                remove_labels=[self.label],
             )
-            jira_client.remove_label(issue_key, self.label)
             return f"No PR found for {issue_key}"
 
-        # Get PR info including head branch and changed files
+        # Get PR info including head branch and changed files. The clone
+        # cache is only refreshed (by clone_repo) once a review is certain
         pr_info = github_client.get_pr_info(pr_number)
         changed_files = pr_info["changed_files"]
 
+        if all(f.lower().endswith(NON_CODE_EXTENSIONS) for f in changed_files):
+            jira_client.update_issue(
+                issue_key,
+                comment=(
+                    f"{SECURITY_REVIEW_SKIPPED_HEADER}\n\n"
+                    f"PR #{pr_number} changes no code files "
+                    f"({len(changed_files)} documentation or image file(s))."
+                ),
+                remove_labels=[self.label],
+            )
+            return f"Skipped security review for PR #{pr_number}: no code changes"
+
         # Clone the PR's head branch to review the actual changes
         work_dir = github_client.clone_repo(branch=pr_info["head_branch"])
 
         try:
-            # Format changed files list for the prompt
-            changed_files_text = "\n".join(f"- {f}" for f in changed_files)
+            # Format changed files list for the prompt, rolled up if very long
+            changed_files_text = format_changed_files(changed_files)
 
             # Run Claude for security review (read-only tools)
             template_path = os.path.join(self._prompts_dir, "security_review.md")
@@ -82,19 +105,18 @@ class SecurityReviewAction(BaseAction):
                 action="security_review",
             )
 
-            header = "SECURITY REVIEW"
-            comment = f"{header}\n{'=' * len(header)}\n\n{result.content}"
+            comment = f"{SECURITY_REVIEW_HEADER}\n\n{result.content}"
             github_client.add_pr_comment(pr_number, comment)
 
-            complete_header = "SECURITY REVIEW COMPLETE"
-            jira_client.add_comment(
+            jira_client.update_issue(
                 issue_key,
-                f"{complete_header}\n"
-                f"{'=' * len(complete_header)}\n\n"
-                f"Review posted to PR #{pr_number}"
-                f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
+                comment=(
+                    f"{SECURITY_REVIEW_COMPLETE_HEADER}\n\n"
+                    f"Review posted to PR #{pr_number}"
+                    f"\n\n---\n_Cost: ${result.cost_usd:.4f}_"
+                ),
+                remove_labels=[self.label],
             )
-            jira_client.remove_label(issue_key, self.label)
 
             return f"Security review complete for PR #{pr_number}"
 
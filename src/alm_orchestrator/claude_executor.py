@@ -2,17 +2,34 @@
 
 import json
 import logging
+import os
 import shutil
 import subprocess
+import tempfile
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from alm_orchestrator.config import DEFAULT_CLAUDE_TIMEOUT_SECONDS
+from alm_orchestrator.prompts import load_prompt_template
+
+try:
+    # Optional C parser for stream-json events; install with the "fast" extra
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+CLAUDE_COMMAND = "claude"
+# Results are posted as comments and Jira rejects comments over 32,767
+# characters; leave room for the header and footer actions add
+MAX_RESULT_CONTENT_CHARS = 30_000
+TRUNCATION_MARKER = "\n\n[... output truncated ...]"
+# Failure details end up in logs and Jira comments; keep them short
+MAX_ERROR_CHARS = 4_000
+
 
 class ClaudeExecutorError(Exception):
     """Raised when Claude Code execution fails."""
@@ -27,6 +44,8 @@ class ClaudeResult:
     duration_ms: int
     session_id: str
     permission_denials: list = field(default_factory=list)
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
 
 
 class ClaudeExecutor:
@@ -46,6 +65,10 @@ class ClaudeExecutor:
         """
         self._prompts_dir = Path(prompts_dir)
         self._timeout = timeout_seconds or DEFAULT_CLAUDE_TIMEOUT_SECONDS
+        # Resolve the CLI once rather than searching PATH on every spawn
+        self._claude_path = shutil.which(CLAUDE_COMMAND) or CLAUDE_COMMAND
+        # Sandbox settings ship with the daemon; read each profile once
+        self._settings_cache: Dict[str, bytes] = {}
 
     def _install_sandbox_settings(self, work_dir: str, action: str) -> None:
         """Install sandbox settings for an action to the working directory.
@@ -57,9 +80,13 @@ class ClaudeExecutor:
         Raises:
             FileNotFoundError: If the settings file doesn't exist.
         """
-        settings_src = self._prompts_dir / f"{action}.json"
-        if not settings_src.exists():
-            raise FileNotFoundError(f"Sandbox settings not found: {settings_src}")
+        settings = self._settings_cache.get(action)
+        if settings is None:
+            settings_src = self._prompts_dir / f"{action}.json"
+            if not settings_src.exists():
+                raise FileNotFoundError(f"Sandbox settings not found: {settings_src}")
+            settings = settings_src.read_bytes()
+            self._settings_cache[action] = settings
 
         # Create .claude directory if needed
         claude_dir = Path(work_dir) / ".claude"
@@ -67,7 +94,7 @@ class ClaudeExecutor:
 
         # Copy settings to settings.local.json (higher precedence than settings.json)
         settings_dst = claude_dir / "settings.local.json"
-        shutil.copy(settings_src, settings_dst)
+        settings_dst.write_bytes(settings)
         logger.info(f"Installed sandbox settings for '{action}' to {settings_dst}")
 
     def execute(
@@ -92,82 +119,138 @@ class ClaudeExecutor:
         self._install_sandbox_settings(work_dir, action)
 
         cmd = [
-            "claude",
+            self._claude_path,
             "-p", prompt,
-            "--output-format", "json",
+            "--output-format", "stream-json",
+            "--verbose",
         ]
 
         logger.info(
             f"Executing Claude Code CLI in {work_dir} "
             f"(action={action}, timeout={self._timeout}s)"
         )
-        logger.info("Running command: claude -p <prompt> --output-format json")
-
-        start_time = time.monotonic()
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=work_dir,
-                capture_output=True,
-                text=True,
-                timeout=self._timeout,
-            )
-        except subprocess.TimeoutExpired as e:
-            raise ClaudeExecutorError(
-                f"Claude Code timed out after {self._timeout} seconds"
-            ) from e
-        finally:
-            elapsed = time.monotonic() - start_time
-            logger.info(f"Claude Code CLI completed in {elapsed:.1f}s")
-
-        if result.returncode != 0:
-            error_msg = result.stderr or result.stdout or "Unknown error"
-            raise ClaudeExecutorError(f"Claude Code failed: {error_msg}")
-
-        # Parse JSON output
-        try:
-            data = json.loads(result.stdout)
-
-            # Check for permission denials (potential prompt injection or missing permissions)
-            denials = data.get("permission_denials", [])
-            if denials:
-                denied_tools = [d.get("tool", "unknown") for d in denials]
-                logger.warning(
-                    f"Permission denials detected: {denied_tools}. "
-                    f"This may indicate prompt injection or insufficient permissions. "
-                    f"Details: {denials}"
+        logger.info("Running command: claude -p <prompt> --output-format stream-json --verbose")
+
+        # Claude output goes to an unlinked temp file rather than a pipe, so
+        # large results are not accumulated chunk by chunk in memory
+        with tempfile.TemporaryFile() as stdout_file:
+            start_time = time.monotonic()
+            try:
+                result = subprocess.run(
+                    cmd,
+                    cwd=work_dir,
+                    stdout=stdout_file,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    timeout=self._timeout,
+                )
+            except subprocess.TimeoutExpired as e:
+                raise ClaudeExecutorError(
+                    f"Claude Code timed out after {self._timeout} seconds"
+                ) from e
+            finally:
+                elapsed = time.monotonic() - start_time
+                logger.info(f"Claude Code CLI completed in {elapsed:.1f}s")
+
+            stdout_file.seek(0)
+            if result.returncode != 0:
+                error_msg = self._failure_message(result.stderr, stdout_file)
+                raise ClaudeExecutorError(f"Claude Code failed: {error_msg}")
+
+            data = self._read_result_event(stdout_file)
+            if data is None:
+                # Fall back to raw output if no result event was emitted
+                stdout_file.seek(0)
+                # Never more than 4 bytes per character, so this is enough
+                raw = stdout_file.read(4 * MAX_RESULT_CONTENT_CHARS + 1)
+                return ClaudeResult(
+                    content=_bound_content(raw.decode(errors="replace")),
+                    cost_usd=0.0,
+                    duration_ms=0,
+                    session_id="",
+                    permission_denials=[],
                 )
 
-            return ClaudeResult(
-                content=data.get("result", ""),
-                cost_usd=data.get("cost_usd", 0.0),
-                duration_ms=data.get("duration_ms", 0),
-                session_id=data.get("session_id", ""),
-                permission_denials=denials,
-            )
-        except json.JSONDecodeError:
-            # Fall back to raw output if JSON parsing fails
-            return ClaudeResult(
-                content=result.stdout,
-                cost_usd=0.0,
-                duration_ms=0,
-                session_id="",
-                permission_denials=[],
+        # Check for permission denials (potential prompt injection or missing permissions)
+        denials = data.get("permission_denials", [])
+        if denials:
+            denied_tools = [d.get("tool", "unknown") for d in denials]
+            logger.warning(
+                f"Permission denials detected: {denied_tools}. "
+                f"This may indicate prompt injection or insufficient permissions. "
+                f"Details: {denials}"
             )
 
+        # The CLI caches stable prompt prefixes itself; log hits to verify it
+        usage = data.get("usage") or {}
+        cache_created = usage.get("cache_creation_input_tokens", 0)
+        cache_read = usage.get("cache_read_input_tokens", 0)
+        logger.info(
+            f"Prompt cache tokens: {cache_read} read, {cache_created} written"
+        )
+
+        return ClaudeResult(
+            content=_bound_content(data.get("result", "")),
+            cost_usd=data.get("cost_usd", 0.0),
+            duration_ms=data.get("duration_ms", 0),
+            session_id=data.get("session_id", ""),
+            permission_denials=denials,
+            cache_creation_input_tokens=cache_created,
+            cache_read_input_tokens=cache_read,
+        )
+
+    @staticmethod
+    def _read_result_event(stream) -> Optional[dict]:
+        """Find the final result event in stream-json output.
+
+        Events are parsed one line at a time, so only the current event is
+        held in memory rather than the whole transcript.
+
+        Args:
+            stream: Binary file positioned at the start of the output.
+
+        Returns:
+            The last event with type "result", or None if there is none.
+        """
+        result_event = None
+        for line in stream:
+            try:
+                event = _json_loads(line)
+            except ValueError:
+                # JSONDecodeError and UnicodeDecodeError (both parsers)
+                continue
+            if isinstance(event, dict) and event.get("type") == "result":
+                result_event = event
+        return result_event
+
     @staticmethod
-    def _escape_format_string(value: str) -> str:
-        """Escape curly braces in user input to prevent format string injection.
+    def _failure_message(stderr: Optional[str], stream) -> str:
+        """Describe a failed run without echoing the whole transcript.
+
+        Prefers stderr, then the error or result of the final result event,
+        then the tail of the raw output. Each is capped at MAX_ERROR_CHARS.
 
         Args:
-            value: The string value to escape.
+            stderr: Captured stderr of the CLI.
+            stream: Binary file positioned at the start of the output.
 
         Returns:
-            String with { and } replaced by {{ and }}.
+            A bounded error description.
         """
-        if not isinstance(value, str):
-            return value
-        return value.replace("{", "{{").replace("}", "}}")
+        if stderr:
+            return _bound_content(stderr, MAX_ERROR_CHARS)
+
+        event = ClaudeExecutor._read_result_event(stream)
+        if event is not None:
+            message = event.get("error") or event.get("result")
+            if message:
+                return _bound_content(str(message), MAX_ERROR_CHARS)
+
+        # Errors are reported last, so keep the end of the output
+        size = stream.seek(0, os.SEEK_END)
+        stream.seek(max(0, size - 4 * MAX_ERROR_CHARS))
+        tail = stream.read().decode(errors="replace")[-MAX_ERROR_CHARS:]
+        return tail or "Unknown error"
 
     def execute_with_template(
         self,
@@ -191,15 +274,16 @@ class ClaudeExecutor:
             ClaudeExecutorError: If execution fails.
             FileNotFoundError: If template doesn't exist.
         """
-        with open(template_path, "r") as f:
-            template = f.read()
+        template = load_prompt_template(template_path)
 
-        # Escape curly braces in context values to prevent format string injection
-        # (SEC-001: user-controlled Jira content could contain {malicious} patterns)
-        safe_context = {
-            key: self._escape_format_string(value)
-            for key, value in context.items()
-        }
-
-        prompt = template.format(**safe_context)
+        # Single-pass $-substitution: user-controlled Jira content is inserted
+        # verbatim and never interpreted as template syntax (SEC-001)
+        prompt = template.safe_substitute(context)
         return self.execute(work_dir, prompt, action)
+
+
+def _bound_content(content: str, limit: int = MAX_RESULT_CONTENT_CHARS) -> str:
+    """Truncate content to limit characters, marking the cut."""
+    if len(content) <= limit:
+        return content
+    return content[:limit] + TRUNCATION_MARKER
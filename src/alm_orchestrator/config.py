@@ -2,6 +2,7 @@
 
 import os
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 
@@ -12,7 +13,10 @@ class ConfigError(Exception):
 
 # Default values
 DEFAULT_POLL_INTERVAL_SECONDS = 30
+DEFAULT_WEBHOOK_POLL_INTERVAL_SECONDS = 900  # 15 minutes, fallback when webhooks are enabled
+DEFAULT_MAX_POLL_INTERVAL_SECONDS = 3600  # 1 hour, idle backoff ceiling when webhooks are enabled
 DEFAULT_CLAUDE_TIMEOUT_SECONDS = 600  # 10 minutes
+DEFAULT_MAX_CONCURRENT_ACTIONS = 4
 DEFAULT_ATLASSIAN_TOKEN_URL = "https://auth.atlassian.com/oauth/token"
 DEFAULT_ATLASSIAN_RESOURCES_URL = "https://api.atlassian.com/oauth/token/accessible-resources"
 DEFAULT_ATLASSIAN_API_URL_PATTERN = "https://api.atlassian.com/ex/jira/{cloud_id}"
@@ -30,19 +34,25 @@ class Config:
     jira_client_id: str
     jira_client_secret: str
     poll_interval_seconds: int = DEFAULT_POLL_INTERVAL_SECONDS
+    max_poll_interval_seconds: int = DEFAULT_MAX_POLL_INTERVAL_SECONDS
     claude_timeout_seconds: int = DEFAULT_CLAUDE_TIMEOUT_SECONDS
+    max_concurrent_actions: int = DEFAULT_MAX_CONCURRENT_ACTIONS
     anthropic_api_key: Optional[str] = None
     atlassian_token_url: str = DEFAULT_ATLASSIAN_TOKEN_URL
     atlassian_resources_url: str = DEFAULT_ATLASSIAN_RESOURCES_URL
     atlassian_api_url_pattern: str = DEFAULT_ATLASSIAN_API_URL_PATTERN
     github_clone_url_pattern: str = DEFAULT_GITHUB_CLONE_URL_PATTERN
+    webhook_port: Optional[int] = None
+    webhook_secret: Optional[str] = None
+    github_clone_cache_dir: Optional[str] = None
 
-    @property
+    # cached_property stores on the instance __dict__, bypassing the frozen __setattr__
+    @cached_property
     def github_owner(self) -> str:
         """Extract owner from 'owner/repo' format."""
         return self.github_repo.split("/")[0]
 
-    @property
+    @cached_property
     def github_repo_name(self) -> str:
         """Extract repo name from 'owner/repo' format."""
         return self.github_repo.split("/")[1]
@@ -67,12 +77,43 @@ class Config:
         if missing:
             raise ConfigError(f"Missing required environment variables: {', '.join(missing)}")
 
-        poll_interval = os.getenv("POLL_INTERVAL_SECONDS", str(DEFAULT_POLL_INTERVAL_SECONDS))
+        max_concurrent = os.getenv("MAX_CONCURRENT_ACTIONS", str(DEFAULT_MAX_CONCURRENT_ACTIONS))
+        try:
+            max_concurrent_int = int(max_concurrent)
+        except ValueError:
+            raise ConfigError(f"MAX_CONCURRENT_ACTIONS must be an integer, got: {max_concurrent}")
+        if max_concurrent_int < 1:
+            raise ConfigError(f"MAX_CONCURRENT_ACTIONS must be at least 1, got: {max_concurrent_int}")
+
+        webhook_port = os.getenv("WEBHOOK_PORT")
+        webhook_port_int = None
+        if webhook_port:
+            try:
+                webhook_port_int = int(webhook_port)
+            except ValueError:
+                raise ConfigError(f"WEBHOOK_PORT must be an integer, got: {webhook_port}")
+
+        # With webhooks enabled, polling is only a safety net for missed events
+        default_poll_interval = (
+            DEFAULT_WEBHOOK_POLL_INTERVAL_SECONDS if webhook_port_int
+            else DEFAULT_POLL_INTERVAL_SECONDS
+        )
+        poll_interval = os.getenv("POLL_INTERVAL_SECONDS", str(default_poll_interval))
         try:
             poll_interval_int = int(poll_interval)
         except ValueError:
             raise ConfigError(f"POLL_INTERVAL_SECONDS must be an integer, got: {poll_interval}")
 
+        max_poll_interval = os.getenv(
+            "MAX_POLL_INTERVAL_SECONDS", str(DEFAULT_MAX_POLL_INTERVAL_SECONDS)
+        )
+        try:
+            max_poll_interval_int = int(max_poll_interval)
+        except ValueError:
+            raise ConfigError(
+                f"MAX_POLL_INTERVAL_SECONDS must be an integer, got: {max_poll_interval}"
+            )
+
         claude_timeout = os.getenv("CLAUDE_TIMEOUT_SECONDS", str(DEFAULT_CLAUDE_TIMEOUT_SECONDS))
         try:
             claude_timeout_int = int(claude_timeout)
@@ -87,7 +128,9 @@ class Config:
             github_token=os.environ["GITHUB_TOKEN"],
             github_repo=os.environ["GITHUB_REPO"],
             poll_interval_seconds=poll_interval_int,
+            max_poll_interval_seconds=max_poll_interval_int,
             claude_timeout_seconds=claude_timeout_int,
+            max_concurrent_actions=max_concurrent_int,
             anthropic_api_key=os.getenv("ANTHROPIC_API_KEY"),
             atlassian_token_url=os.getenv(
                 "ATLASSIAN_TOKEN_URL",
@@ -105,4 +148,7 @@ class Config:
                 "GITHUB_CLONE_URL_PATTERN",
                 DEFAULT_GITHUB_CLONE_URL_PATTERN
             ),
+            webhook_port=webhook_port_int,
+            webhook_secret=os.getenv("WEBHOOK_SECRET") or None,
+            github_clone_cache_dir=os.getenv("GITHUB_CLONE_CACHE_DIR") or None,
         )
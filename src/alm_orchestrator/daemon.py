@@ -1,22 +1,36 @@
 """Main daemon loop for the ALM Orchestrator."""
 
+import asyncio
 import logging
+import os
+import queue
 import signal
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Hashable, Iterable, Optional, Set, Tuple
 
+from alm_orchestrator.actions.base import format_header
 from alm_orchestrator.config import Config
 from alm_orchestrator.jira_client import JiraClient
 from alm_orchestrator.github_client import GitHubClient
 from alm_orchestrator.claude_executor import ClaudeExecutor
 from alm_orchestrator.router import discover_actions
+from alm_orchestrator.webhook import WebhookServer
 
 
 logger = logging.getLogger(__name__)
 
+ACTION_FAILED_HEADER = format_header("ACTION FAILED")
+
 
 class Daemon:
     """Long-running daemon that polls Jira and processes AI labels."""
 
+    # Window in which a repeat of an already-dispatched label is ignored
+    RECENTLY_PROCESSED_TTL_SECONDS = 120
+
     def __init__(self, config: Config, prompts_dir: str):
         """Initialize the daemon.
 
@@ -24,9 +38,21 @@ class Daemon:
             config: Application configuration.
             prompts_dir: Path to prompt templates directory.
         """
+        # Resolve once so actions build stable absolute template paths
+        # (which also key the template cache) regardless of later chdir
+        prompts_dir = os.path.abspath(prompts_dir)
         self._config = config
         self._prompts_dir = prompts_dir
         self._running = False
+        self._pending: "queue.Queue[str]" = queue.Queue()
+        self._webhook: Optional[WebhookServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._poll_requested = False
+        # Background polls and webhook batches, awaited on shutdown
+        self._tasks: "Set[asyncio.Task]" = set()
+        self._recently_processed: "OrderedDict[Tuple[str, str, Hashable], float]" = OrderedDict()
+        self._recently_processed_lock = threading.Lock()
 
         # Initialize clients
         self._jira = JiraClient(config)
@@ -36,6 +62,12 @@ class Daemon:
             timeout_seconds=config.claude_timeout_seconds
         )
 
+        # Worker threads for the blocking action clients
+        self._executor = ThreadPoolExecutor(
+            max_workers=config.max_concurrent_actions,
+            thread_name_prefix="action",
+        )
+
         # Auto-discover and register all actions
         self._router = discover_actions(prompts_dir)
         logger.info(f"Discovered {self._router.action_count} action(s): {', '.join(self._router.action_names)}")
@@ -52,70 +84,353 @@ class Daemon:
     def stop(self) -> None:
         """Stop the daemon."""
         self._running = False
+        self._wake_loop()
+
+    def kick(self) -> None:
+        """Poll Jira now instead of waiting for the poll interval.
+
+        Safe to call from any thread or signal handler.
+        """
+        self._poll_requested = True
+        self._wake_loop()
+
+    def _wake_loop(self) -> None:
+        """Wake the daemon loop if it is waiting between polls."""
+        if self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    def close(self) -> None:
+        """Release worker threads and HTTP connection pools."""
+        self._executor.shutdown()
+        self._jira.close()
+        self._github.close()
 
-    def poll_once(self) -> int:
+    def enqueue_issue(self, issue_key: str) -> None:
+        """Queue an issue for processing on the next loop iteration.
+
+        Called from the webhook listener thread.
+
+        Args:
+            issue_key: The issue key (e.g., "TEST-123").
+        """
+        self._pending.put(issue_key)
+        self._wake_loop()
+
+    async def poll_once(self) -> int:
         """Execute a single poll cycle.
 
+        Issues are processed concurrently, up to max_concurrent_actions at once.
+
         Returns:
             Number of issues processed.
         """
-        issues = self._jira.fetch_issues_with_ai_labels()
+        issues = await asyncio.to_thread(self._jira.fetch_issues_with_ai_labels)
         logger.info(f"Found {len(issues)} issue(s) with AI labels")
+        return await self._process_issues(issues)
+
+    async def process_pending(self) -> int:
+        """Process issues queued by the webhook listener.
+
+        Returns:
+            Number of issues processed.
+        """
+        issue_keys = []
+        while True:
+            try:
+                issue_key = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            if issue_key not in issue_keys:
+                issue_keys.append(issue_key)
+
+        if not issue_keys:
+            return 0
+
+        # Webhooks can name any issue the credentials can see; only act on
+        # the configured project, as the polling JQL does
+        project_prefix = f"{self._config.jira_project_key}-"
+        issues = []
+        for issue_key in issue_keys:
+            if not issue_key.startswith(project_prefix):
+                logger.warning(
+                    f"Ignoring webhook for {issue_key}: not in project "
+                    f"{self._config.jira_project_key}"
+                )
+                continue
+            try:
+                issue = await asyncio.to_thread(self._jira.get_issue, issue_key)
+            except Exception as e:
+                # A deleted or forbidden issue must not drop the rest of the batch
+                logger.error(f"Error fetching {issue_key} from webhook: {e}")
+                continue
+            if JiraClient.PROCESSING_LABEL in issue.fields.labels:
+                logger.debug(f"Skipping {issue_key}: already being processed")
+                continue
+            issues.append(issue)
+
+        return await self._process_issues(issues)
+
+    async def _process_issues(self, issues: Iterable) -> int:
+        """Process issues concurrently in worker threads.
+
+        Actions use blocking Jira/GitHub/Claude clients, so each issue runs on
+        the daemon's thread pool, which allows up to max_concurrent_actions
+        issues in flight at once.
+
+        Args:
+            issues: Jira issue objects to process.
+
+        Returns:
+            Number of actions completed successfully.
+        """
+        loop = asyncio.get_running_loop()
+        issues = list(issues)
+        results = await asyncio.gather(
+            *(loop.run_in_executor(self._executor, self._process_issue, issue) for issue in issues),
+            return_exceptions=True,
+        )
+
         processed = 0
+        for issue, result in zip(issues, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error processing {issue.key}: {result}")
+            else:
+                processed += result
+        return processed
+
+    def _process_issue(self, issue) -> int:
+        """Run the registered action for each AI label on an issue.
 
-        for issue in issues:
-            ai_labels = self._jira.get_ai_labels(issue)
-
-            for label in ai_labels:
-                if self._router.has_action(label):
-                    # Remove original label and mark as processing to prevent duplicate pickup
-                    self._jira.remove_label(issue.key, label)
-                    self._jira.add_label(issue.key, JiraClient.PROCESSING_LABEL)
-
-                    try:
-                        logger.info(f"Processing {issue.key} with action: {label}")
-                        action = self._router.get_action(label)
-                        result = action.execute(
-                            issue=issue,
-                            jira_client=self._jira,
-                            github_client=self._github,
-                            claude_executor=self._claude,
-                        )
-                        logger.info(f"Completed: {result}")
-                        processed += 1
-                    except Exception as e:
-                        logger.error(f"Error processing {issue.key}/{label}: {e}")
-                        # Post error to Jira as comment (fail fast)
-                        header = "ACTION FAILED"
-                        self._jira.add_comment(
-                            issue.key,
-                            f"{header}\n{'=' * len(header)}\n\nLabel: {label}\n\nCheck logs for details."
-                        )
-                    finally:
-                        # Always remove processing label
-                        self._jira.remove_label(issue.key, JiraClient.PROCESSING_LABEL)
+        Args:
+            issue: Jira issue object.
+
+        Returns:
+            Number of actions completed successfully.
+        """
+        processed = 0
+        ai_labels = self._jira.get_ai_labels(issue)
+
+        for label in ai_labels:
+            action = self._router.find_action(label)
+            if action is not None:
+                if not self._claim(issue, label):
+                    logger.info(f"Skipping {issue.key}/{label}: already processed")
+                    continue
+
+                # Swap the original label for the processing label in one request
+                # to prevent duplicate pickup
+                self._jira.update_issue(
+                    issue.key,
+                    remove_labels=[label],
+                    add_labels=[JiraClient.PROCESSING_LABEL],
+                )
+
+                try:
+                    logger.info(f"Processing {issue.key} with action: {label}")
+                    result = action.execute(
+                        issue=issue,
+                        jira_client=self._jira,
+                        github_client=self._github,
+                        claude_executor=self._claude,
+                    )
+                    logger.info(f"Completed: {result}")
+                    processed += 1
+                except Exception as e:
+                    logger.error(f"Error processing {issue.key}/{label}: {e}")
+                    # Post error to Jira as comment (fail fast)
+                    self._jira.add_comment(
+                        issue.key,
+                        f"{ACTION_FAILED_HEADER}\n\nLabel: {label}\n\nCheck logs for details."
+                    )
+                finally:
+                    # Always remove processing label
+                    self._jira.remove_label(issue.key, JiraClient.PROCESSING_LABEL)
 
         return processed
 
-    def run(self) -> None:
+    def _claim(self, issue, label: str) -> bool:
+        """Record that a label is being dispatched, unless it was just handled.
+
+        Jira search results can lag behind label removals, so an issue may be
+        returned again with a label this daemon already processed. Entries are
+        keyed by the issue's updated timestamp, so a label re-added by a user
+        (which bumps the timestamp) is dispatched again.
+
+        Args:
+            issue: Jira issue object.
+            label: The AI label about to be processed.
+
+        Returns:
+            True if the caller should process the label, False if it is a repeat.
+        """
+        key = (issue.key, label, getattr(issue.fields, "updated", None))
+        now = time.monotonic()
+        with self._recently_processed_lock:
+            # Entries are in insertion order, so expired ones are at the front
+            while self._recently_processed:
+                oldest_key, claimed_at = next(iter(self._recently_processed.items()))
+                if now - claimed_at < self.RECENTLY_PROCESSED_TTL_SECONDS:
+                    break
+                del self._recently_processed[oldest_key]
+
+            if key in self._recently_processed:
+                return False
+            self._recently_processed[key] = now
+            return True
+
+    async def run(self) -> None:
         """Run the daemon loop."""
         self._running = True
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
         poll_interval = self._config.poll_interval_seconds
 
         logger.info(f"Starting daemon, polling every {poll_interval} seconds")
 
+        # SIGUSR1 triggers an immediate poll
+        try:
+            self._loop.add_signal_handler(signal.SIGUSR1, self.kick)
+        except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+            logger.debug("SIGUSR1 wakeup not available on this platform")
+
+        if self._config.webhook_port:
+            self._webhook = WebhookServer(
+                self._config.webhook_port,
+                self.enqueue_issue,
+                secret=self._config.webhook_secret,
+            )
+            self._webhook.start()
+
+        idle_polls = 0
         while self._running:
+            self._poll_requested = False
+            poll = self._spawn(self.poll_once())
+            # A poll's actions can run for many minutes; keep handling
+            # webhook events until it finishes
+            await self._handle_events_until(poll)
             try:
-                processed = self.poll_once()
+                processed = poll.result()
                 if processed > 0:
                     logger.info(f"Processed {processed} issue(s)")
+                    idle_polls = 0
+                else:
+                    idle_polls += 1
             except Exception as e:
                 logger.error(f"Error in poll cycle: {e}")
 
-            # Sleep in small increments to allow for quick shutdown
-            for _ in range(poll_interval):
-                if not self._running:
-                    break
-                time.sleep(1)
+            await self._wait_for_next_poll(
+                self._next_poll_interval(poll_interval, idle_polls)
+            )
+
+        # Let in-flight actions finish before the worker threads shut down
+        if self._tasks:
+            logger.info(f"Waiting for {len(self._tasks)} running task(s) to finish")
+            await asyncio.gather(*self._tasks, return_exceptions=True)
 
+        if self._webhook is not None:
+            self._webhook.stop()
+            self._webhook = None
+
+        try:
+            self._loop.remove_signal_handler(signal.SIGUSR1)
+        except (AttributeError, NotImplementedError, RuntimeError, ValueError):
+            pass
+        self._loop = None
+        self._wake = None
+
+        self.close()
         logger.info("Daemon stopped")
+
+    def _spawn(self, coro: Awaitable) -> asyncio.Task:
+        """Run a coroutine as a background task tracked until it finishes.
+
+        Args:
+            coro: Coroutine to run.
+
+        Returns:
+            The scheduled task.
+        """
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _process_pending_logged(self) -> None:
+        """Process queued webhook events, logging rather than raising errors."""
+        try:
+            await self.process_pending()
+        except Exception as e:
+            logger.error(f"Error processing webhook events: {e}")
+
+    def _dispatch_pending(self) -> None:
+        """Start processing queued webhook events without waiting for them.
+
+        Each batch runs as its own task, so a long-running action never
+        holds up later events; the thread pool still caps how many actions
+        run at once.
+        """
+        if not self._pending.empty():
+            self._spawn(self._process_pending_logged())
+
+    async def _handle_events_until(self, task: asyncio.Task) -> None:
+        """Handle webhook events until a task finishes.
+
+        Once the daemon is stopped, no new events are dispatched and this
+        only waits for the task.
+
+        Args:
+            task: Task to wait for.
+        """
+        task.add_done_callback(lambda _: self._wake.set())
+        while not task.done():
+            # Clear before dispatching so events queued meanwhile wake us again
+            self._wake.clear()
+            if self._running:
+                self._dispatch_pending()
+            await self._wake.wait()
+
+    def _next_poll_interval(self, poll_interval: int, idle_polls: int) -> int:
+        """Back off exponentially while polls keep finding no work.
+
+        Only applies while the webhook listener is running: webhook events
+        and kick() still wake the daemon immediately, so a longer interval
+        only delays the fallback poll. Without webhooks, polling is the only
+        way work is picked up and the configured interval is kept. The
+        interval grows up to max_poll_interval_seconds.
+
+        Args:
+            poll_interval: Configured seconds between polls.
+            idle_polls: Consecutive polls that processed nothing.
+
+        Returns:
+            Seconds to wait before the next poll.
+        """
+        if self._webhook is None or idle_polls <= 1:
+            return poll_interval
+        ceiling = max(poll_interval, self._config.max_poll_interval_seconds)
+        # Cap the exponent so quiet weekends don't build huge integers
+        return min(poll_interval * 2 ** min(idle_polls - 1, 16), ceiling)
+
+    async def _wait_for_next_poll(self, poll_interval: int) -> None:
+        """Handle webhook events until the next poll is due.
+
+        Returns when the poll interval elapses, when kick() requests a poll,
+        or when the daemon is stopped.
+
+        Args:
+            poll_interval: Seconds until the next fallback poll.
+        """
+        deadline = self._loop.time() + poll_interval
+
+        while self._running:
+            # Clear before dispatching so events queued meanwhile wake us again
+            self._wake.clear()
+            self._dispatch_pending()
+
+            timeout = deadline - self._loop.time()
+            if self._poll_requested or timeout <= 0:
+                return
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except TimeoutError:
+                return
@@ -1,9 +1,15 @@
 """GitHub API client for the ALM Orchestrator."""
 
 import logging
+import os
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
 from github import Github
 from alm_orchestrator.config import Config
 
@@ -14,6 +20,19 @@ logger = logging.getLogger(__name__)
 DEFAULT_BRANCH = "main"
 CLONE_DEPTH = 1
 TEMP_DIR_PREFIX = "alm-orchestrator-"
+CACHE_REFSPEC = "+refs/heads/*:refs/heads/*"
+# Skip re-fetching a cache updated this recently; clones still read refs
+# from origin, so a slightly stale cache only means more objects to download
+CLONE_CACHE_MAX_AGE_SECONDS = 60
+# Automatic gc is disabled on the cache; repack it after this many fetches
+CLONE_CACHE_GC_INTERVAL_FETCHES = 50
+# Unreachable objects younger than this survive gc, so work clones still
+# borrowing them through --reference keep working
+CLONE_CACHE_GC_PRUNE = "2.weeks.ago"
+# Code and security reviews of the same PR often run back to back
+PR_INFO_CACHE_TTL_SECONDS = 60
+# PRs kept in the PR info cache; older entries are evicted first
+PR_INFO_CACHE_MAX_ENTRIES = 100
 
 
 class GitHubClient:
@@ -28,6 +47,30 @@ class GitHubClient:
         self._config = config
         self._github = Github(config.github_token)
         self._repo = self._github.get_repo(config.github_repo)
+        # Built once for every git subprocess; git fails fast instead of
+        # waiting on a credential prompt nobody can answer
+        self._git_env = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+        self._clone_url = config.github_clone_url_pattern.format(
+            token=config.github_token,
+            repo=config.github_repo
+        )
+        # Serializes updates to the shared clone cache across concurrent actions
+        self._cache_lock = threading.Lock()
+        # Signalled when a clone stops reading from the cache, so gc can wait
+        # for in-flight clones to finish
+        self._cache_idle = threading.Condition(self._cache_lock)
+        self._cache_readers = 0
+        self._cache_updated_at: Optional[float] = None
+        self._cache_fetches = 0
+        self._cache_remote_removed = False
+        # pr_number -> (fetched_at, pr_info), kept in fetch order so
+        # expired entries are at the front
+        self._pr_info_cache: "OrderedDict[int, Tuple[float, dict]]" = OrderedDict()
+        self._pr_info_cache_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close pooled HTTP connections held by the GitHub API client."""
+        self._github.close()
 
     def get_authenticated_clone_url(self) -> str:
         """Get clone URL with embedded auth token.
@@ -35,14 +78,16 @@ class GitHubClient:
         Returns:
             HTTPS clone URL with token for authentication.
         """
-        return self._config.github_clone_url_pattern.format(
-            token=self._config.github_token,
-            repo=self._config.github_repo
-        )
+        return self._clone_url
 
     def clone_repo(self, branch: str = DEFAULT_BRANCH) -> str:
         """Clone the repository to a temporary directory.
 
+        When a clone cache is configured, objects are borrowed from a local
+        bare repository (kept up to date with an incremental fetch), so only
+        objects missing from the cache are downloaded. Only the requested
+        branch is fetched, without tags.
+
         Args:
             branch: Branch to clone. Defaults to DEFAULT_BRANCH.
 
@@ -54,16 +99,152 @@ class GitHubClient:
         """
         work_dir = tempfile.mkdtemp(prefix=TEMP_DIR_PREFIX)
         clone_url = self.get_authenticated_clone_url()
+        cache_dir = self._update_clone_cache()
+
+        if cache_dir:
+            clone_args = ["--reference", cache_dir]
+        else:
+            clone_args = ["--depth", str(CLONE_DEPTH)]
 
         logger.info(f"Cloning {self._config.github_repo} (branch: {branch}) to {work_dir}")
+        if cache_dir:
+            # Registered under the cache lock, so this clone either waits for
+            # a running gc to finish or makes the next gc wait for it
+            with self._cache_lock:
+                self._cache_readers += 1
+        try:
+            subprocess.run(
+                [
+                    "git", "clone", *clone_args,
+                    "--single-branch", "--no-tags",
+                    "--branch", branch, clone_url, work_dir,
+                ],
+                check=True,
+                # Git output is unused on success; keep stderr for CalledProcessError
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                env=self._git_env,
+            )
+        finally:
+            if cache_dir:
+                with self._cache_lock:
+                    self._cache_readers -= 1
+                    self._cache_idle.notify_all()
+        logger.info(f"Clone completed: {work_dir}")
+
+        return work_dir
+
+    def _update_clone_cache(self) -> Optional[str]:
+        """Create or refresh the local bare repository used as a clone reference.
+
+        Returns:
+            Path to the cache repository, or None if caching is disabled or
+            the cache could not be updated.
+        """
+        cache_root = self._config.github_clone_cache_dir
+        if not cache_root:
+            return None
+
+        cache_dir = os.path.join(
+            cache_root,
+            f"{self._config.github_owner}-{self._config.github_repo_name}.git",
+        )
+
+        with self._cache_lock:
+            if (
+                self._cache_updated_at is not None
+                and time.monotonic() - self._cache_updated_at < CLONE_CACHE_MAX_AGE_SECONDS
+                and os.path.isdir(cache_dir)
+            ):
+                return cache_dir
+
+            try:
+                if not os.path.isdir(cache_dir):
+                    logger.info(f"Creating clone cache: {cache_dir}")
+                    os.makedirs(cache_root, mode=0o700, exist_ok=True)
+                    self._run_cache_git(["git", "init", "--quiet", "--bare", cache_dir])
+                    # Never gc in the background while a fetch or clone is
+                    # using the cache; _gc_clone_cache repacks it under the
+                    # cache lock instead
+                    for key, value in (("gc.auto", "0"), ("maintenance.auto", "false")):
+                        self._run_cache_git(["git", "-C", cache_dir, "config", key, value])
+                elif not self._cache_remote_removed:
+                    # Caches created by earlier versions stored the
+                    # token-bearing URL as origin; drop it (refs are kept)
+                    subprocess.run(
+                        ["git", "-C", cache_dir, "config", "--remove-section", "remote.origin"],
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        env=self._git_env,
+                    )
+                self._cache_remote_removed = True
+
+                # Fetch from the URL directly rather than a stored remote, so
+                # the token never reaches the cache's config or FETCH_HEAD and
+                # a rotated token is picked up on the next fetch
+                logger.info(f"Updating clone cache: {cache_dir}")
+                self._run_cache_git([
+                    "git", "-C", cache_dir, "fetch", "--quiet", "--prune", "--no-tags",
+                    "--no-write-fetch-head", self._clone_url, CACHE_REFSPEC,
+                ])
+                self._cache_fetches += 1
+                if self._cache_fetches % CLONE_CACHE_GC_INTERVAL_FETCHES == 0:
+                    self._gc_clone_cache(cache_dir)
+            except (subprocess.CalledProcessError, OSError) as e:
+                # Best effort: an unwritable cache dir or missing git binary
+                # must not fail the action
+                logger.warning(f"Clone cache unavailable, cloning without it: {e}")
+                return None
+            self._cache_updated_at = time.monotonic()
+
+        return cache_dir
+
+    def _run_cache_git(self, args: List[str]) -> None:
+        """Run a git command against the clone cache.
+
+        Args:
+            args: Full git command line.
+
+        Raises:
+            subprocess.CalledProcessError: If the command fails.
+        """
         subprocess.run(
-            ["git", "clone", "--depth", str(CLONE_DEPTH), "--branch", branch, clone_url, work_dir],
+            args,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=self._git_env,
         )
-        logger.info(f"Clone completed: {work_dir}")
 
-        return work_dir
+    def _gc_clone_cache(self, cache_dir: str) -> None:
+        """Consolidate the packs that accumulate from incremental fetches.
+
+        Called with the cache lock held, which keeps fetches out; clones
+        reading the cache are waited for before gc starts. Clones keep
+        borrowing objects through their alternates after they finish, which
+        the two-week prune grace period covers. A failed gc leaves the cache
+        usable, so it is logged rather than raised.
+
+        Args:
+            cache_dir: Path to the cache repository.
+        """
+        self._cache_idle.wait_for(lambda: self._cache_readers == 0)
+        logger.info(f"Running gc on clone cache: {cache_dir}")
+        try:
+            self._run_cache_git(
+                ["git", "-C", cache_dir, "gc", "--quiet", f"--prune={CLONE_CACHE_GC_PRUNE}"]
+            )
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.warning(f"Clone cache gc failed: {e}")
+
+    def prefetch_clone_cache(self) -> None:
+        """Bring the clone cache up to date ahead of clone_repo.
+
+        Lets callers overlap the cache fetch with other I/O. A following
+        clone_repo reuses the fresh cache instead of fetching again.
+        No-op when no clone cache is configured.
+        """
+        self._update_clone_cache()
 
     def create_branch(self, work_dir: str, branch_name: str) -> None:
         """Create and checkout a new branch.
@@ -80,7 +261,9 @@ class GitHubClient:
             ["git", "checkout", "-b", branch_name],
             cwd=work_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=self._git_env,
         )
         logger.info(f"Branch created: {branch_name}")
 
@@ -103,7 +286,9 @@ class GitHubClient:
             ["git", "add", "-A"],
             cwd=work_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=self._git_env,
         )
 
         logger.info(f"Committing changes for {issue_key}")
@@ -111,7 +296,9 @@ class GitHubClient:
             ["git", "commit", "-m", message],
             cwd=work_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=self._git_env,
         )
 
         logger.info(f"Pushing branch: {branch}")
@@ -119,7 +306,9 @@ class GitHubClient:
             ["git", "push", "-u", "origin", branch],
             cwd=work_dir,
             check=True,
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=self._git_env,
         )
         logger.info(f"Push completed: {branch}")
 
@@ -168,8 +357,9 @@ class GitHubClient:
             body: Comment text (supports GitHub markdown).
         """
         logger.info(f"Adding comment to PR #{pr_number}")
-        pr = self._repo.get_pull(pr_number)
-        pr.create_issue_comment(body)
+        # PR comments live on the issues endpoint; the lazy Issue posts
+        # there directly instead of first fetching the pull request
+        self._repo.get_issue(pr_number).create_comment(body)
 
     def get_pr_info(self, pr_number: int) -> dict:
         """Get PR information including head branch, changed files, and description.
@@ -180,16 +370,43 @@ class GitHubClient:
         Returns:
             Dict with keys: head_branch, base_branch, changed_files, title, body.
         """
-        logger.info(f"Getting PR info for #{pr_number}")
-        pr = self._repo.get_pull(pr_number)
-        changed_files = [f.filename for f in pr.get_files()]
-        return {
-            "head_branch": pr.head.ref,
-            "base_branch": pr.base.ref,
-            "changed_files": changed_files,
-            "title": pr.title,
-            "body": pr.body or "",
-        }
+        with self._pr_info_cache_lock:
+            cached = self._pr_info_cache.get(pr_number)
+        if cached and time.monotonic() - cached[0] < PR_INFO_CACHE_TTL_SECONDS:
+            logger.debug(f"Using cached PR info for #{pr_number}")
+            pr_info = cached[1]
+        else:
+            logger.info(f"Getting PR info for #{pr_number}")
+            pr = self._repo.get_pull(pr_number)
+            changed_files = [f.filename for f in pr.get_files()]
+            pr_info = {
+                "head_branch": pr.head.ref,
+                "base_branch": pr.base.ref,
+                "changed_files": changed_files,
+                "title": pr.title,
+                "body": pr.body or "",
+            }
+            self._cache_pr_info(pr_number, pr_info)
+        return {**pr_info, "changed_files": list(pr_info["changed_files"])}
+
+    def _cache_pr_info(self, pr_number: int, pr_info: dict) -> None:
+        """Cache PR info, evicting expired and excess entries.
+
+        Args:
+            pr_number: The PR number.
+            pr_info: PR info dict as returned by get_pr_info.
+        """
+        now = time.monotonic()
+        with self._pr_info_cache_lock:
+            self._pr_info_cache.pop(pr_number, None)
+            self._pr_info_cache[pr_number] = (now, pr_info)
+            while len(self._pr_info_cache) > PR_INFO_CACHE_MAX_ENTRIES:
+                self._pr_info_cache.popitem(last=False)
+            while self._pr_info_cache:
+                fetched_at, _ = next(iter(self._pr_info_cache.values()))
+                if now - fetched_at < PR_INFO_CACHE_TTL_SECONDS:
+                    break
+                self._pr_info_cache.popitem(last=False)
 
     def get_pr_by_branch(self, branch: str):
         """Find an open PR for a given branch.
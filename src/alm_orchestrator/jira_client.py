@@ -1,11 +1,18 @@
 """Jira API client for the ALM Orchestrator."""
 
+import gzip
+import json
 import logging
+import threading
 import time
-from typing import List, Optional
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
 
 import requests
 from jira import JIRA, Issue
+from jira.exceptions import JIRAError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from alm_orchestrator.config import Config
 
 logger = logging.getLogger(__name__)
@@ -16,6 +23,14 @@ OAUTH_GRANT_TYPE = "client_credentials"
 OAUTH_CONTENT_TYPE = "application/x-www-form-urlencoded"
 DEFAULT_TOKEN_EXPIRY_SECONDS = 3600  # 1 hour
 
+# HTTP connection pooling and retry settings for Atlassian auth endpoints
+HTTP_POOL_MAXSIZE = 10
+HTTP_RETRY_TOTAL = 3
+HTTP_RETRY_BACKOFF_FACTOR = 0.2
+HTTP_RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+# urllib3 skips POST by default; a client-credentials grant is safe to resend
+HTTP_RETRY_ALLOWED_METHODS = frozenset({"GET", "POST"})
+
 
 class OAuthTokenManager:
     """Manages OAuth 2.0 access tokens for Atlassian service accounts."""
@@ -39,11 +54,32 @@ class OAuthTokenManager:
         self._access_token: Optional[str] = None
         self._expires_at: Optional[float] = None
         self._cloud_id: Optional[str] = None
+        # Actions run on worker threads; only one of them refreshes the token
+        # or looks up the cloud ID
+        self._refresh_lock = threading.Lock()
+
+        # Reuse one keep-alive connection pool across token refreshes
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=HTTP_RETRY_TOTAL,
+                backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+                status_forcelist=HTTP_RETRY_STATUS_FORCELIST,
+                allowed_methods=HTTP_RETRY_ALLOWED_METHODS,
+            ),
+        ))
+
+    def close(self) -> None:
+        """Close pooled HTTP connections."""
+        self._session.close()
 
     def get_token(self) -> str:
         """Get a valid access token, refreshing if necessary."""
         if self._needs_refresh():
-            self._refresh_token()
+            with self._refresh_lock:
+                if self._needs_refresh():
+                    self._refresh_token()
         return self._access_token
 
     def get_cloud_id(self) -> str:
@@ -52,7 +88,9 @@ class OAuthTokenManager:
         Must be called after get_token() to ensure we have a valid token.
         """
         if self._cloud_id is None:
-            self._fetch_cloud_id()
+            with self._refresh_lock:
+                if self._cloud_id is None:
+                    self._fetch_cloud_id()
         return self._cloud_id
 
     def get_api_url(self) -> str:
@@ -71,7 +109,7 @@ class OAuthTokenManager:
 
     def _refresh_token(self) -> None:
         """Fetch a new access token using client credentials."""
-        response = requests.post(
+        response = self._session.post(
             self._token_url,
             data={
                 "grant_type": OAUTH_GRANT_TYPE,
@@ -86,12 +124,11 @@ class OAuthTokenManager:
         self._access_token = data["access_token"]
         expires_in = data.get("expires_in", DEFAULT_TOKEN_EXPIRY_SECONDS)
         self._expires_at = time.time() + expires_in
-        # Reset cloud_id so it gets re-fetched with new token if needed
-        self._cloud_id = None
+        # The cloud ID identifies the site, not the token, so it is kept
 
     def _fetch_cloud_id(self) -> None:
         """Fetch the cloud ID from accessible resources."""
-        response = requests.get(
+        response = self._session.get(
             self._resources_url,
             headers={
                 "Authorization": f"Bearer {self._access_token}",
@@ -120,8 +157,19 @@ class JiraClient:
         "ai-security-review",
     ])
 
+    # Fixed order for label dispatch and the search JQL
+    _AI_LABELS_SORTED = tuple(sorted(AI_LABELS))
     PROCESSING_LABEL = "ai-processing"
     MAX_RESULTS = 50
+    # Fields read by the daemon and actions; comments prime the comments cache
+    SEARCH_FIELDS = "summary,description,labels,issuetype,comment,updated"
+    COMMENTS_CACHE_TTL_SECONDS = 60
+    # Issues kept in the comments cache; older entries are evicted first
+    COMMENTS_CACHE_MAX_ISSUES = 200
+    # Newest comments fetched per issue; lookups only need recent ones
+    COMMENTS_MAX_RESULTS = 100
+    # Request bodies larger than this are sent gzip-compressed
+    GZIP_MIN_BYTES = 4096
 
     def __init__(self, config: Config):
         """Initialize Jira client with configuration.
@@ -130,6 +178,13 @@ class JiraClient:
             config: Application configuration containing Jira credentials.
         """
         self._config = config
+        # Built once, with labels sorted so the query text is identical on every poll
+        labels_clause = ", ".join(f'"{label}"' for label in self._AI_LABELS_SORTED)
+        self._ai_labels_jql = (
+            f'project = {config.jira_project_key} '
+            f'AND labels in ({labels_clause}) '
+            f'AND labels != "{self.PROCESSING_LABEL}"'
+        )
         self._token_manager = OAuthTokenManager(
             client_id=config.jira_client_id,
             client_secret=config.jira_client_secret,
@@ -138,9 +193,23 @@ class JiraClient:
             api_url_pattern=config.atlassian_api_url_pattern,
         )
         self._jira: Optional[JIRA] = None
+        self._jira_token: Optional[str] = None
         self._account_id: Optional[str] = None
+        # issue_key -> (fetched_at, comments), shared by all comment lookups
+        # and kept in fetch order so expired entries are at the front
+        self._comments_cache: "OrderedDict[str, Tuple[float, List[dict]]]" = OrderedDict()
+        self._comments_cache_lock = threading.Lock()
+        # Cleared if the server rejects compressed request bodies
+        self._gzip_requests = True
         self._fetch_account_id()
 
+    def close(self) -> None:
+        """Close pooled HTTP connections held by this client."""
+        self._token_manager.close()
+        if self._jira is not None:
+            self._jira.close()
+            self._jira = None
+
     @property
     def account_id(self) -> str:
         """The Jira account ID of this service account."""
@@ -149,8 +218,8 @@ class JiraClient:
     def _get_jira(self) -> JIRA:
         """Get a JIRA client with a valid access token.
 
-        The client is recreated when the token is refreshed to ensure
-        the Bearer token in the Authorization header is always valid.
+        When the token is refreshed, the new Bearer token is installed on
+        the existing client session, keeping its pooled connections.
 
         For OAuth 2.0 service accounts, we use api.atlassian.com with
         the cloudId instead of the direct instance URL.
@@ -158,7 +227,6 @@ class JiraClient:
         # Get current token (will refresh if needed)
         token = self._token_manager.get_token()
 
-        # Recreate client if token was refreshed or doesn't exist yet
         if self._jira is None:
             # Service accounts must use api.atlassian.com endpoint
             api_url = self._token_manager.get_api_url()
@@ -166,6 +234,14 @@ class JiraClient:
                 server=api_url,
                 token_auth=token,
             )
+            # Size the pool for the daemon's action threads so concurrent
+            # actions don't discard and re-handshake connections
+            self._jira._session.mount("https://", HTTPAdapter(
+                pool_maxsize=max(HTTP_POOL_MAXSIZE, self._config.max_concurrent_actions),
+            ))
+        elif token != self._jira_token:
+            self._jira._create_token_session(token)
+        self._jira_token = token
         return self._jira
 
     def _fetch_account_id(self) -> None:
@@ -179,18 +255,47 @@ class JiraClient:
         """Fetch all issues in the project that have at least one AI label.
 
         Excludes issues currently being processed (ai-processing label).
+        Comments are fetched in the same search and used to prime the
+        comments cache, so actions do not need a separate request per issue.
 
         Returns:
             List of Jira issues with AI labels.
         """
-        labels_clause = ", ".join(f'"{label}"' for label in self.AI_LABELS)
-        jql = (
-            f'project = {self._config.jira_project_key} '
-            f'AND labels in ({labels_clause}) '
-            f'AND labels != "{self.PROCESSING_LABEL}"'
+        issues = self._get_jira().search_issues(
+            self._ai_labels_jql, maxResults=self.MAX_RESULTS, fields=self.SEARCH_FIELDS
         )
+        for issue in issues:
+            self._prime_comments_cache(issue)
+        return issues
 
-        return self._get_jira().search_issues(jql, maxResults=self.MAX_RESULTS)
+    def _prime_comments_cache(self, issue: Issue) -> None:
+        """Cache comments returned inline with a search result.
+
+        Skipped when Jira truncated the inline comment list, in which case
+        get_comments fetches the full list on demand.
+        """
+        comment_field = getattr(issue.fields, "comment", None)
+        if comment_field is None:
+            return
+        comments = comment_field.comments
+        total = getattr(comment_field, "total", None)
+        if isinstance(total, int) and total > len(comments):
+            return
+        newest_first = sorted(comments, key=lambda c: c.created, reverse=True)
+        self._cache_comments(issue.key, self._to_comment_dicts(newest_first))
+
+    def get_issue(self, issue_key: str) -> Issue:
+        """Fetch a single issue by key.
+
+        Args:
+            issue_key: The issue key (e.g., "TEST-123").
+
+        Returns:
+            The Jira issue.
+        """
+        issue = self._get_jira().issue(issue_key, fields=self.SEARCH_FIELDS)
+        self._prime_comments_cache(issue)
+        return issue
 
     def get_ai_labels(self, issue: Issue) -> List[str]:
         """Extract AI labels from an issue.
@@ -199,10 +304,10 @@ class JiraClient:
             issue: Jira issue object.
 
         Returns:
-            List of AI label strings found on the issue.
+            List of AI label strings found on the issue, sorted.
         """
-        issue_labels = set(issue.fields.labels)
-        return sorted(list(issue_labels & self.AI_LABELS))
+        issue_labels = issue.fields.labels
+        return [label for label in self._AI_LABELS_SORTED if label in issue_labels]
 
     def get_issue_description(self, issue: Issue) -> str:
         """Get the description text from an issue.
@@ -234,38 +339,143 @@ class JiraClient:
             body: The comment text (supports Jira markup).
         """
         self._get_jira().add_comment(issue_key, body)
+        self._invalidate_comments(issue_key)
+
+    def update_issue(
+        self,
+        issue_key: str,
+        *,
+        comment: Optional[str] = None,
+        remove_labels: Sequence[str] = (),
+        add_labels: Sequence[str] = (),
+    ) -> None:
+        """Add a comment and change labels in a single Jira request.
+
+        Uses the edit-issue "update" operations so both changes are applied
+        server-side in one PUT, without reading the issue first. Jira rejects
+        the combined request with 400 when a field is not on the issue's edit
+        screen; the changes are then applied with separate calls.
+
+        Args:
+            issue_key: The issue key (e.g., "TEST-123").
+            comment: Comment text to add (supports Jira markup).
+            remove_labels: Labels to remove from the issue.
+            add_labels: Labels to add to the issue.
+        """
+        update = {}
+        if comment is not None:
+            update["comment"] = [{"add": {"body": comment}}]
+        if remove_labels or add_labels:
+            update["labels"] = (
+                [{"remove": label} for label in remove_labels]
+                + [{"add": label} for label in add_labels]
+            )
+        if not update:
+            return
+
+        jira = self._get_jira()
+        try:
+            self._put_json(jira, jira._get_url(f"issue/{issue_key}"), {"update": update})
+        except JIRAError as e:
+            if e.status_code != 400:
+                raise
+            logger.warning(
+                f"Combined update rejected for {issue_key} (HTTP 400), "
+                f"falling back to separate requests"
+            )
+            if comment is not None:
+                self.add_comment(issue_key, comment)
+            if remove_labels or add_labels:
+                self._replace_labels(issue_key, remove_labels, add_labels)
+            return
+
+        if comment is not None:
+            self._invalidate_comments(issue_key)
+
+    def _put_json(self, jira: JIRA, url: str, payload: dict) -> None:
+        """PUT a JSON payload, gzip-compressing large bodies.
+
+        Comments embed full Claude output, so bodies are often several KB.
+        If the server rejects a compressed body, the request is resent
+        uncompressed. Compression is disabled for this client only when that
+        retry succeeds; a 400 caused by the payload itself fails both ways.
+
+        Args:
+            jira: JIRA client whose session sends the request.
+            url: Absolute REST URL.
+            payload: JSON-serializable request body.
+        """
+        data = json.dumps(payload).encode("utf-8")
+        if self._gzip_requests and len(data) > self.GZIP_MIN_BYTES:
+            try:
+                jira._session.put(
+                    url,
+                    data=gzip.compress(data),
+                    headers={"Content-Encoding": "gzip"},
+                )
+                return
+            except JIRAError as e:
+                if e.status_code not in (400, 415):
+                    raise
+                logger.info(
+                    f"Jira rejected gzip request body (HTTP {e.status_code}), "
+                    f"retrying uncompressed"
+                )
+                jira._session.put(url, data=data)
+                logger.info("Uncompressed request accepted; disabling gzip request bodies")
+                self._gzip_requests = False
+                return
+        jira._session.put(url, data=data)
+
+    def _replace_labels(
+        self,
+        issue_key: str,
+        remove_labels: Sequence[str],
+        add_labels: Sequence[str],
+    ) -> None:
+        """Apply label changes by reading and rewriting the full label list.
+
+        Fallback for servers that reject label update operations.
+        """
+        issue = self._get_jira().issue(issue_key, fields="labels")
+        current_labels = list(issue.fields.labels)
+        new_labels = [label for label in current_labels if label not in remove_labels]
+        new_labels += [label for label in add_labels if label not in new_labels]
+
+        if new_labels != current_labels:
+            issue.update(fields={"labels": new_labels})
 
     def add_label(self, issue_key: str, label: str) -> None:
         """Add a label to a Jira issue.
 
+        Sent as a single update operation; adding a label the issue
+        already has is a no-op on the server.
+
         Args:
             issue_key: The issue key (e.g., "TEST-123").
             label: The label to add.
         """
-        issue = self._get_jira().issue(issue_key)
-        current_labels = list(issue.fields.labels)
-
-        if label not in current_labels:
-            current_labels.append(label)
-            issue.update(fields={"labels": current_labels})
+        self.update_issue(issue_key, add_labels=[label])
 
     def remove_label(self, issue_key: str, label: str) -> None:
         """Remove a label from a Jira issue.
 
+        Sent as a single update operation; removing a label the issue
+        does not have is a no-op on the server.
+
         Args:
             issue_key: The issue key (e.g., "TEST-123").
             label: The label to remove.
         """
-        issue = self._get_jira().issue(issue_key)
-        current_labels = list(issue.fields.labels)
-
-        if label in current_labels:
-            current_labels.remove(label)
-            issue.update(fields={"labels": current_labels})
+        self.update_issue(issue_key, remove_labels=[label])
 
     def get_comments(self, issue_key: str) -> List[dict]:
         """Get comments for an issue, sorted newest-first.
 
+        Results are cached per issue for COMMENTS_CACHE_TTL_SECONDS so that
+        multiple lookups during one action share a single Jira request.
+        The cache is invalidated when this client adds a comment.
+
         Args:
             issue_key: The issue key (e.g., "TEST-123").
 
@@ -273,20 +483,60 @@ class JiraClient:
             List of comment dicts with body, author_id, and created fields,
             ordered from newest to oldest.
         """
-        issue = self._get_jira().issue(issue_key, fields="comment")
-        comments = issue.fields.comment.comments
-        sorted_comments = sorted(
-            comments,
-            key=lambda c: c.created,
-            reverse=True
+        with self._comments_cache_lock:
+            cached = self._comments_cache.get(issue_key)
+        if cached is not None:
+            fetched_at, comments = cached
+            if time.monotonic() - fetched_at < self.COMMENTS_CACHE_TTL_SECONDS:
+                return list(comments)
+
+        comments = self._fetch_comments(issue_key)
+        self._cache_comments(issue_key, comments)
+        return list(comments)
+
+    def _cache_comments(self, issue_key: str, comments: List[dict]) -> None:
+        """Cache an issue's comments, evicting expired and excess entries.
+
+        Args:
+            issue_key: The issue key (e.g., "TEST-123").
+            comments: Comment dicts, newest first.
+        """
+        now = time.monotonic()
+        with self._comments_cache_lock:
+            self._comments_cache.pop(issue_key, None)
+            self._comments_cache[issue_key] = (now, comments)
+            while len(self._comments_cache) > self.COMMENTS_CACHE_MAX_ISSUES:
+                self._comments_cache.popitem(last=False)
+            while self._comments_cache:
+                fetched_at, _ = next(iter(self._comments_cache.values()))
+                if now - fetched_at < self.COMMENTS_CACHE_TTL_SECONDS:
+                    break
+                self._comments_cache.popitem(last=False)
+
+    def _invalidate_comments(self, issue_key: str) -> None:
+        """Drop an issue's cached comments so the next lookup refetches."""
+        with self._comments_cache_lock:
+            self._comments_cache.pop(issue_key, None)
+
+    def _fetch_comments(self, issue_key: str) -> List[dict]:
+        """Fetch the newest comments for an issue, sorted and limited by Jira."""
+        comments = self._get_jira().comments(
+            issue_key,
+            max_results=self.COMMENTS_MAX_RESULTS,
+            order_by="-created",
         )
+        return self._to_comment_dicts(comments)
+
+    @staticmethod
+    def _to_comment_dicts(comments) -> List[dict]:
+        """Convert Jira comment resources to dicts, preserving order."""
         return [
             {
                 "body": c.body,
                 "author_id": c.author.accountId,
                 "created": c.created,
             }
-            for c in sorted_comments
+            for c in comments
         ]
 
     def get_comment_by_header(self, issue_key: str, header: str) -> Optional[str]:
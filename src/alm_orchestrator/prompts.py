@@ -0,0 +1,35 @@
+"""Prompt template loading for the ALM Orchestrator."""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+
+# Enough for every prompt template plus a few stale revisions
+TEMPLATE_CACHE_SIZE = 32
+
+
+def load_prompt_template(path: str) -> Template:
+    """Load a prompt template as a compiled string.Template.
+
+    Templates use $name / ${name} placeholders. Substitution is a single
+    pass, so placeholder syntax inside substituted values is never expanded.
+
+    Each call costs a stat(); the file is read again only when its
+    modification time changes, so edited prompts apply without a restart.
+
+    Args:
+        path: Path to the template file.
+
+    Returns:
+        The compiled template.
+
+    Raises:
+        FileNotFoundError: If the template doesn't exist.
+    """
+    return _compile_template(path, os.stat(path).st_mtime_ns)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _compile_template(path: str, mtime_ns: int) -> Template:
+    return Template(Path(path).read_text(encoding="utf-8"))
@@ -1,14 +1,9 @@
 """Label-to-action routing for the ALM Orchestrator."""
 
-from typing import Dict, List
+from typing import Dict, List, Optional
 from alm_orchestrator.actions.base import BaseAction
 
 
-class UnknownLabelError(Exception):
-    """Raised when no action is registered for a label."""
-    pass
-
-
 class LabelRouter:
     """Routes AI labels to their corresponding action handlers."""
 
@@ -25,32 +20,16 @@ class LabelRouter:
         """
         self._actions[label] = action
 
-    def get_action(self, label: str) -> BaseAction:
-        """Get the action handler for a label.
-
-        Args:
-            label: The AI label.
-
-        Returns:
-            The registered action handler.
-
-        Raises:
-            UnknownLabelError: If no action is registered for the label.
-        """
-        if label not in self._actions:
-            raise UnknownLabelError(f"No action registered for label: {label}")
-        return self._actions[label]
-
-    def has_action(self, label: str) -> bool:
-        """Check if an action is registered for a label.
+    def find_action(self, label: str) -> Optional[BaseAction]:
+        """Look up the action handler for a label.
 
         Args:
             label: The AI label.
 
         Returns:
-            True if an action is registered, False otherwise.
+            The registered action handler, or None if there is none.
         """
-        return label in self._actions
+        return self._actions.get(label)
 
     @property
     def action_count(self) -> int:
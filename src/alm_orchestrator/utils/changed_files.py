@@ -0,0 +1,51 @@
+"""Utility functions for summarizing PR changed-file lists in prompts."""
+
+import posixpath
+from typing import Dict, List
+
+# Prompt budget for the changed-files list
+MAX_CHANGED_FILE_LINES = 200
+# Directories with more changed files than this collapse to one line
+DIRECTORY_ROLLUP_THRESHOLD = 5
+
+
+def format_changed_files(
+    changed_files: List[str],
+    max_lines: int = MAX_CHANGED_FILE_LINES,
+    rollup_threshold: int = DIRECTORY_ROLLUP_THRESHOLD,
+) -> str:
+    """Format changed files as a Markdown list that fits the prompt budget.
+
+    Lists that fit within max_lines are returned in full. Longer lists
+    collapse busy directories into "- dir/ (N files)" entries, and anything
+    still over budget is truncated with a count of the omitted entries.
+
+    Args:
+        changed_files: File paths changed by the PR.
+        max_lines: Maximum number of list entries to emit.
+        rollup_threshold: Directories with more files than this are collapsed
+            when the full list is over budget.
+
+    Returns:
+        Newline-separated Markdown list entries.
+    """
+    if len(changed_files) <= max_lines:
+        return "\n".join(f"- {f}" for f in changed_files)
+
+    by_directory: Dict[str, List[str]] = {}
+    for path in changed_files:
+        by_directory.setdefault(posixpath.dirname(path), []).append(path)
+
+    lines = []
+    for directory, files in by_directory.items():
+        if len(files) > rollup_threshold:
+            lines.append(f"- {directory or '.'}/ ({len(files)} files)")
+        else:
+            lines.extend(f"- {f}" for f in files)
+
+    if len(lines) > max_lines:
+        omitted = len(lines) - max_lines
+        lines = lines[:max_lines]
+        lines.append(f"- ... and {omitted} more entries")
+
+    return "\n".join(lines)
@@ -1,7 +1,15 @@
 """Utility functions for extracting PR references from text."""
 
 import re
-from typing import List, Optional
+from itertools import chain
+from typing import Iterable, Optional
+
+# PR reference patterns, in priority order
+PR_PATTERNS = (
+    re.compile(r"github\.com/[^/]+/[^/]+/pull/(\d+)", re.IGNORECASE),
+    re.compile(r"PR[:\s#]+(\d+)", re.IGNORECASE),
+    re.compile(r"Pull Request[:\s#]+(\d+)", re.IGNORECASE),
+)
 
 
 def extract_pr_number(text: str) -> Optional[int]:
@@ -18,35 +26,32 @@ def extract_pr_number(text: str) -> Optional[int]:
     Returns:
         PR number if found, None otherwise.
     """
-    patterns = [
-        r"github\.com/[^/]+/[^/]+/pull/(\d+)",
-        r"PR[:\s#]+(\d+)",
-        r"Pull Request[:\s#]+(\d+)",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    # Every pattern needs "pr" or "pull"; most comments have neither
+    lowered = text.lower()
+    if "pr" not in lowered and "pull" not in lowered:
+        return None
+    for pattern in PR_PATTERNS:
+        match = pattern.search(text)
         if match:
             return int(match.group(1))
     return None
 
 
-def find_pr_in_texts(description: str, comments: List[str]) -> Optional[int]:
+def find_pr_in_texts(description: str, comments: Iterable[str]) -> Optional[int]:
     """Find PR number, checking description first, then comments.
 
+    Stops at the first text with a PR reference, so comments after the
+    match are never read. Passing a generator avoids materializing them.
+
     Args:
         description: Issue description text.
-        comments: List of comment bodies, sorted newest-first.
+        comments: Comment bodies, sorted newest-first.
 
     Returns:
         PR number if found, None otherwise.
     """
-    pr_number = extract_pr_number(description)
-    if pr_number:
-        return pr_number
-
-    for comment in comments:
-        pr_number = extract_pr_number(comment)
+    for text in chain([description], comments):
+        pr_number = extract_pr_number(text)
         if pr_number:
             return pr_number
-
     return None
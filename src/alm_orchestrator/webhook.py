@@ -0,0 +1,177 @@
+"""Jira webhook listener for the ALM Orchestrator."""
+
+import hashlib
+import hmac
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# Webhook constants
+WEBHOOK_PATH = "/webhooks/jira"
+WEBHOOK_EVENTS = frozenset([
+    "jira:issue_created",
+    "jira:issue_updated",
+])
+DEFAULT_WEBHOOK_HOST = "0.0.0.0"
+MAX_PAYLOAD_BYTES = 1024 * 1024  # 1 MB
+SIGNATURE_HEADER = "X-Hub-Signature"
+SIGNATURE_PREFIX = "sha256="
+
+
+class _JiraWebhookHandler(BaseHTTPRequestHandler):
+    """Handles Jira webhook POSTs and forwards issue keys to the daemon."""
+
+    # Set on the server instance by WebhookServer
+    server: "_WebhookHTTPServer"
+
+    def do_POST(self) -> None:
+        """Accept a Jira issue event and queue the issue for processing."""
+        if self.path.split("?", 1)[0] != WEBHOOK_PATH:
+            self._respond(404)
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            self._respond(400)
+            return
+
+        if length <= 0 or length > MAX_PAYLOAD_BYTES:
+            self._respond(413 if length > MAX_PAYLOAD_BYTES else 400)
+            return
+
+        body = self.rfile.read(length)
+        if not verify_signature(
+            self.server.secret, body, self.headers.get(SIGNATURE_HEADER)
+        ):
+            logger.warning("Rejected webhook with missing or invalid signature")
+            self._respond(401)
+            return
+
+        try:
+            payload = json.loads(body)
+        except json.JSONDecodeError:
+            self._respond(400)
+            return
+
+        issue_key = parse_issue_key(payload)
+        if issue_key:
+            logger.info(f"Webhook received {payload.get('webhookEvent')} for {issue_key}")
+            self.server.on_issue(issue_key)
+
+        # Acknowledge quickly; Jira retries on slow or failed deliveries
+        self._respond(202)
+
+    def _respond(self, status: int) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        """Route http.server access logs through the module logger."""
+        logger.debug(format % args)
+
+
+class _WebhookHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    on_issue: Callable[[str], None]
+    secret: Optional[bytes]
+
+
+def verify_signature(secret: Optional[bytes], body: bytes, signature: Optional[str]) -> bool:
+    """Check a Jira webhook HMAC signature.
+
+    Jira signs payloads of webhooks registered with a secret and sends
+    the digest as "sha256=<hex>" in the X-Hub-Signature header.
+
+    Args:
+        secret: Shared webhook secret, or None to accept unsigned requests.
+        body: Raw request body.
+        signature: Value of the signature header, if present.
+
+    Returns:
+        True if no secret is configured or the signature matches.
+    """
+    if secret is None:
+        return True
+    if not signature or not signature.startswith(SIGNATURE_PREFIX):
+        return False
+    expected = hmac.new(secret, body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature[len(SIGNATURE_PREFIX):])
+
+
+def parse_issue_key(payload: dict) -> Optional[str]:
+    """Extract the issue key from a Jira webhook payload.
+
+    Args:
+        payload: Decoded webhook JSON body.
+
+    Returns:
+        The issue key for supported issue events, None otherwise.
+    """
+    if not isinstance(payload, dict):
+        return None
+    if payload.get("webhookEvent") not in WEBHOOK_EVENTS:
+        return None
+    issue = payload.get("issue")
+    if not isinstance(issue, dict):
+        return None
+    return issue.get("key") or None
+
+
+class WebhookServer:
+    """Background HTTP server that receives Jira issue webhooks."""
+
+    def __init__(
+        self,
+        port: int,
+        on_issue: Callable[[str], None],
+        host: str = DEFAULT_WEBHOOK_HOST,
+        secret: Optional[str] = None,
+    ):
+        """Initialize the webhook server.
+
+        Args:
+            port: TCP port to listen on (0 picks a free port).
+            on_issue: Callback invoked with the issue key of each event.
+            host: Interface to bind. Defaults to all interfaces.
+            secret: Shared secret for verifying request signatures. When
+                unset, unsigned requests are accepted.
+        """
+        self._server = _WebhookHTTPServer((host, port), _JiraWebhookHandler)
+        self._server.on_issue = on_issue
+        self._server.secret = secret.encode() if secret else None
+        self._thread: Optional[threading.Thread] = None
+        if self._server.secret is None:
+            logger.warning(
+                "WEBHOOK_SECRET is not set; unsigned webhook requests are accepted "
+                "from anyone who can reach this port"
+            )
+
+    @property
+    def port(self) -> int:
+        """The port the server is bound to."""
+        return self._server.server_address[1]
+
+    def start(self) -> None:
+        """Start serving requests in a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="jira-webhook",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Listening for Jira webhooks on port {self.port} at {WEBHOOK_PATH}")
+
+    def stop(self) -> None:
+        """Stop the server and release the socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
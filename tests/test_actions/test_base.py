@@ -1,8 +1,10 @@
 """Tests for BaseAction validation."""
 
+import logging
+
 import pytest
 from unittest.mock import MagicMock
-from alm_orchestrator.actions.base import BaseAction
+from alm_orchestrator.actions.base import BaseAction, format_header
 
 
 class ConcreteAction(BaseAction):
@@ -33,12 +35,10 @@ class TestValidateIssueType:
         result = action.validate_issue_type(mock_issue, mock_jira)
 
         assert result is True
-        mock_jira.add_comment.assert_not_called()
-        mock_jira.remove_label.assert_not_called()
+        mock_jira.update_issue.assert_not_called()
 
     def test_invalid_issue_type_returns_false_and_posts_comment(self, caplog):
         """Invalid issue type returns False, posts comment, removes label, logs DEBUG."""
-        import logging
         caplog.set_level(logging.DEBUG)
 
         mock_issue = MagicMock()
@@ -53,16 +53,16 @@ class TestValidateIssueType:
         assert result is False
 
         # Verify comment was posted
-        mock_jira.add_comment.assert_called_once()
-        comment_args = mock_jira.add_comment.call_args[0]
-        assert comment_args[0] == "TEST-123"
-        assert "INVALID ISSUE TYPE" in comment_args[1]
-        assert "ai-test" in comment_args[1]
-        assert "Bug" in comment_args[1]
-        assert "Story" in comment_args[1]
+        mock_jira.update_issue.assert_called_once()
+        comment_args = mock_jira.update_issue.call_args
+        assert comment_args[0][0] == "TEST-123"
+        assert "INVALID ISSUE TYPE" in comment_args[1]["comment"]
+        assert "ai-test" in comment_args[1]["comment"]
+        assert "Bug" in comment_args[1]["comment"]
+        assert "Story" in comment_args[1]["comment"]
 
         # Verify label was removed
-        mock_jira.remove_label.assert_called_once_with("TEST-123", "ai-test")
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-test"]
 
         # Verify DEBUG log
         assert any(
@@ -97,5 +97,9 @@ class TestValidateIssueTypeNoValidation:
         result = action.validate_issue_type(mock_issue, mock_jira)
 
         assert result is True
-        mock_jira.add_comment.assert_not_called()
-        mock_jira.remove_label.assert_not_called()
+        mock_jira.update_issue.assert_not_called()
+
+
+class TestFormatHeader:
+    def test_underlines_title(self):
+        assert format_header("FIX CREATED") == "FIX CREATED\n==========="
@@ -31,11 +31,11 @@ class TestCodeReviewAction:
 
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
+        mock_jira.update_issue.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.update_issue.call_args[1]["comment"]
         assert "Rejected" in result
 
-    def test_execute_reviews_pr(self, mocker):
+    def test_execute_reviews_pr(self):
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
         mock_issue.fields.summary = "Review fix for orphaned recipes"
@@ -69,6 +69,7 @@ class TestCodeReviewAction:
 
         # Verify PR info was fetched
         mock_github.get_pr_info.assert_called_once_with(42)
+        mock_github.prefetch_clone_cache.assert_called_once()
 
         # Verify repo was cloned with PR's head branch
         mock_github.clone_repo.assert_called_once_with(branch="feature/fix-recipes")
@@ -87,12 +88,12 @@ class TestCodeReviewAction:
         assert "Code Review" in comment
 
         # Verify Jira label removed
-        mock_jira.remove_label.assert_called_with("TEST-123", "ai-code-review")
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-code-review"]
 
         # Verify cleanup
         mock_github.cleanup.assert_called_once()
 
-    def test_execute_no_pr_found(self, mocker):
+    def test_execute_no_pr_found(self):
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
         mock_issue.fields.summary = "Review something"
@@ -108,11 +109,11 @@ class TestCodeReviewAction:
         result = action.execute(mock_issue, mock_jira, mock_github, mock_claude)
 
         # Should post error comment and remove label
-        mock_jira.add_comment.assert_called_once()
-        comment = mock_jira.add_comment.call_args[0][1]
+        mock_jira.update_issue.assert_called_once()
+        comment = mock_jira.update_issue.call_args[1]["comment"]
         assert "Could not find PR" in comment
 
-        mock_jira.remove_label.assert_called_with("TEST-123", "ai-code-review")
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-code-review"]
 
         # Should NOT clone or invoke Claude
         mock_github.clone_repo.assert_not_called()
@@ -195,6 +196,6 @@ class TestCodeReviewPRInComments:
 
         action.execute(mock_issue, mock_jira_client, mock_github_client, mock_claude_executor)
 
-        call_args = mock_jira_client.add_comment.call_args
-        error_message = call_args[0][1]
+        call_args = mock_jira_client.update_issue.call_args
+        error_message = call_args[1]["comment"]
         assert "comments" in error_message.lower()
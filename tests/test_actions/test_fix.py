@@ -1,5 +1,7 @@
 """Tests for fix action handler."""
 
+import logging
+
 import pytest
 from unittest.mock import MagicMock
 from alm_orchestrator.actions.fix import FixAction
@@ -33,15 +35,15 @@ class TestFixAction:
         mock_claude.execute_with_template.assert_not_called()
 
         # Should post rejection comment and remove label
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
-        mock_jira.remove_label.assert_called_once_with("TEST-123", "ai-fix")
+        mock_jira.update_issue.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.update_issue.call_args[1]["comment"]
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-fix"]
 
         # Should return rejection message
         assert "Rejected" in result
         assert "TEST-123" in result
 
-    def test_execute_creates_pr(self, mocker):
+    def test_execute_creates_pr(self):
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
         mock_issue.fields.summary = "Fix orphaned recipes"
@@ -89,17 +91,17 @@ class TestFixAction:
         assert "TEST-123" in pr_kwargs["title"] or "TEST-123" in pr_kwargs["body"]
 
         # Verify Jira comment with PR link
-        mock_jira.add_comment.assert_called()
-        comment_body = mock_jira.add_comment.call_args[0][1]
+        mock_jira.update_issue.assert_called()
+        comment_body = mock_jira.update_issue.call_args[1]["comment"]
         assert "pull/42" in comment_body or mock_pr.html_url in comment_body
 
         # Verify label removed
-        mock_jira.remove_label.assert_called_with("TEST-123", "ai-fix")
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-fix"]
 
         # Verify cleanup
         mock_github.cleanup.assert_called_once_with("/tmp/work-dir")
 
-    def test_cleanup_on_error(self, mocker):
+    def test_cleanup_on_error(self):
         """Verify cleanup happens even when Claude fails."""
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
@@ -122,7 +124,7 @@ class TestFixAction:
         # Cleanup should still happen
         mock_github.cleanup.assert_called_once_with("/tmp/work-dir")
 
-    def test_execute_includes_both_contexts(self, mocker):
+    def test_execute_includes_both_contexts(self):
         """Test that both investigation and recommendation context are passed to Claude."""
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
@@ -166,9 +168,8 @@ class TestFixAction:
         assert "## Prior Investigation" in context["prior_analysis_section"]
         assert "## Recommendations" in context["prior_analysis_section"]
 
-    def test_execute_with_only_investigation(self, mocker, caplog):
+    def test_execute_with_only_investigation(self, caplog):
         """Test that fix works with only investigation context."""
-        import logging
         caplog.set_level(logging.INFO)
 
         mock_issue = MagicMock()
@@ -215,9 +216,8 @@ class TestFixAction:
             for record in caplog.records
         )
 
-    def test_execute_with_only_recommendation(self, mocker, caplog):
+    def test_execute_with_only_recommendation(self, caplog):
         """Test that fix works with only recommendation context."""
-        import logging
         caplog.set_level(logging.INFO)
 
         mock_issue = MagicMock()
@@ -264,9 +264,8 @@ class TestFixAction:
             for record in caplog.records
         )
 
-    def test_execute_without_prior_analysis(self, mocker, caplog):
+    def test_execute_without_prior_analysis(self, caplog):
         """Test that fix works without any prior analysis."""
-        import logging
         caplog.set_level(logging.INFO)
 
         mock_issue = MagicMock()
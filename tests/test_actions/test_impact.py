@@ -30,8 +30,8 @@ class TestImpactAction:
 
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
+        mock_jira.update_issue.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.update_issue.call_args[1]["comment"]
         assert "Rejected" in result
 
     def test_execute_flow(self):
@@ -60,7 +60,7 @@ class TestImpactAction:
 
         mock_github.clone_repo.assert_called_once()
         mock_claude.execute_with_template.assert_called_once()
-        mock_jira.add_comment.assert_called_once()
-        assert "IMPACT ANALYSIS" in mock_jira.add_comment.call_args[0][1]
-        mock_jira.remove_label.assert_called_once_with("TEST-123", "ai-impact")
+        mock_jira.update_issue.assert_called_once()
+        assert "IMPACT ANALYSIS" in mock_jira.update_issue.call_args[1]["comment"]
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-impact"]
         mock_github.cleanup.assert_called_once()
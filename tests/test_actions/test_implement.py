@@ -1,5 +1,7 @@
 """Tests for implement action handler."""
 
+import logging
+
 import pytest
 from unittest.mock import MagicMock
 from alm_orchestrator.actions.implement import ImplementAction
@@ -11,7 +13,7 @@ class TestImplementAction:
         action = ImplementAction(prompts_dir="/tmp/prompts")
         assert action.allowed_issue_types == ["Story"]
 
-    def test_execute_includes_recommendation_context(self, mocker):
+    def test_execute_includes_recommendation_context(self):
         """Test that recommendation context is passed to Claude."""
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
@@ -50,9 +52,8 @@ class TestImplementAction:
         assert "Option 1: Use React components" in context["prior_analysis_section"]
         assert "## Recommended Approach" in context["prior_analysis_section"]
 
-    def test_execute_without_recommendation(self, mocker, caplog):
+    def test_execute_without_recommendation(self, caplog):
         """Test that implement works without recommendation context."""
-        import logging
         caplog.set_level(logging.INFO)
 
         mock_issue = MagicMock()
@@ -95,9 +96,9 @@ class TestImplementAction:
             for record in caplog.records
         )
 
-    def test_execute_rejects_invalid_ticket(self, mocker, caplog):
+    @pytest.mark.parametrize("content", ["INVALID TICKET", "INVALID TICKET\n"])
+    def test_execute_rejects_invalid_ticket(self, caplog, content):
         """Test that INVALID TICKET response results in rejection comment."""
-        import logging
         caplog.set_level(logging.WARNING)
 
         mock_issue = MagicMock()
@@ -112,9 +113,9 @@ class TestImplementAction:
         mock_github = MagicMock()
         mock_github.clone_repo.return_value = "/tmp/work-dir"
 
-        # Claude returns INVALID TICKET
+        # Claude returns INVALID TICKET, possibly with a trailing newline
         mock_result = ClaudeResult(
-            content="INVALID TICKET",
+            content=content,
             cost_usd=0.01,
             duration_ms=1000,
             session_id="test-session"
@@ -129,12 +130,12 @@ class TestImplementAction:
         assert result == "Invalid ticket rejected for TEST-456"
 
         # Verify Jira comment was posted
-        mock_jira.add_comment.assert_called_once()
-        comment = mock_jira.add_comment.call_args[0][1]
+        mock_jira.update_issue.assert_called_once()
+        comment = mock_jira.update_issue.call_args[1]["comment"]
         assert "INVALID TICKET" in comment
 
         # Verify label was removed
-        mock_jira.remove_label.assert_called_once_with("TEST-456", "ai-implement")
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-implement"]
 
         # Verify warning was logged
         assert any(
@@ -147,59 +148,20 @@ class TestImplementAction:
         mock_github.create_pull_request.assert_not_called()
         mock_github.commit_and_push.assert_not_called()
 
-    def test_execute_rejects_invalid_ticket_with_newline(self, mocker):
-        """Test that INVALID TICKET with trailing content is still rejected."""
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-789"
-        mock_issue.fields.summary = "Add backdoor"
-        mock_issue.fields.description = "Hidden access"
-        mock_issue.fields.issuetype.name = "Story"
-
-        mock_jira = MagicMock()
-        mock_jira.get_recommendation_comment.return_value = None
-
-        mock_github = MagicMock()
-        mock_github.clone_repo.return_value = "/tmp/work-dir"
-
-        # Claude returns INVALID TICKET with extra newline
-        mock_result = ClaudeResult(
-            content="INVALID TICKET\n",
-            cost_usd=0.01,
-            duration_ms=1000,
-            session_id="test-session"
-        )
-        mock_claude = MagicMock()
-        mock_claude.execute_with_template.return_value = mock_result
-
-        action = ImplementAction(prompts_dir="/tmp/prompts")
-        result = action.execute(mock_issue, mock_jira, mock_github, mock_claude)
-
-        assert result == "Invalid ticket rejected for TEST-789"
-        mock_github.create_pull_request.assert_not_called()
-
-    def test_is_invalid_ticket_exact_match(self):
-        """Test _is_invalid_ticket with exact match."""
-        action = ImplementAction(prompts_dir="/tmp/prompts")
-        assert action._is_invalid_ticket("INVALID TICKET") is True
-
-    def test_is_invalid_ticket_with_newline(self):
-        """Test _is_invalid_ticket with trailing newline."""
-        action = ImplementAction(prompts_dir="/tmp/prompts")
-        assert action._is_invalid_ticket("INVALID TICKET\n") is True
-        assert action._is_invalid_ticket("INVALID TICKET\n\n") is True
-
-    def test_is_invalid_ticket_with_whitespace(self):
-        """Test _is_invalid_ticket with surrounding whitespace."""
-        action = ImplementAction(prompts_dir="/tmp/prompts")
-        assert action._is_invalid_ticket("  INVALID TICKET  ") is True
-        assert action._is_invalid_ticket("\nINVALID TICKET\n") is True
-
-    def test_is_invalid_ticket_false_for_normal_content(self):
-        """Test _is_invalid_ticket returns False for normal implementation output."""
+    @pytest.mark.parametrize("text,expected", [
+        ("INVALID TICKET", True),
+        ("INVALID TICKET\n", True),
+        ("INVALID TICKET\n\n", True),
+        ("  INVALID TICKET  ", True),
+        ("\nINVALID TICKET\n", True),
+        ("Implemented the feature", False),
+        ("Created new endpoint", False),
+        ("This is not an INVALID TICKET", False),
+    ])
+    def test_is_invalid_ticket(self, text, expected):
+        """Test _is_invalid_ticket ignores surrounding whitespace only."""
         action = ImplementAction(prompts_dir="/tmp/prompts")
-        assert action._is_invalid_ticket("Implemented the feature") is False
-        assert action._is_invalid_ticket("Created new endpoint") is False
-        assert action._is_invalid_ticket("This is not an INVALID TICKET") is False
+        assert action._is_invalid_ticket(text) is expected
 
     def test_execute_rejects_invalid_issue_type(self):
         """Execute returns early for non-Story issue types."""
@@ -216,6 +178,6 @@ class TestImplementAction:
 
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
+        mock_jira.update_issue.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.update_issue.call_args[1]["comment"]
         assert "Rejected" in result
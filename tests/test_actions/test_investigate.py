@@ -33,15 +33,15 @@ class TestInvestigateAction:
         mock_claude.execute_with_template.assert_not_called()
 
         # Should post rejection comment and remove label
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
-        mock_jira.remove_label.assert_called_once_with("TEST-123", "ai-investigate")
+        mock_jira.update_issue.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.update_issue.call_args[1]["comment"]
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-investigate"]
 
         # Should return rejection message
         assert "Rejected" in result
         assert "TEST-123" in result
 
-    def test_execute_flow(self, mocker):
+    def test_execute_flow(self):
         # Setup mocks
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
@@ -77,13 +77,13 @@ class TestInvestigateAction:
         assert call_kwargs["action"] == "investigate"
 
         # Verify comment was posted to Jira
-        mock_jira.add_comment.assert_called_once()
-        comment_args = mock_jira.add_comment.call_args[0]
-        assert comment_args[0] == "TEST-123"
-        assert "Root cause" in comment_args[1]
+        mock_jira.update_issue.assert_called_once()
+        comment_args = mock_jira.update_issue.call_args
+        assert comment_args[0][0] == "TEST-123"
+        assert "Root cause" in comment_args[1]["comment"]
 
         # Verify label was removed
-        mock_jira.remove_label.assert_called_once_with("TEST-123", "ai-investigate")
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-investigate"]
 
         # Verify cleanup
         mock_github.cleanup.assert_called_once_with("/tmp/work-dir")
@@ -91,7 +91,7 @@ class TestInvestigateAction:
         # Verify return message
         assert "TEST-123" in result
 
-    def test_cleanup_on_error(self, mocker):
+    def test_cleanup_on_error(self):
         """Verify cleanup happens even when Claude fails."""
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
@@ -1,5 +1,7 @@
 """Tests for recommend action handler."""
 
+import logging
+
 import pytest
 from unittest.mock import MagicMock
 from alm_orchestrator.actions.recommend import RecommendAction
@@ -30,11 +32,11 @@ class TestRecommendAction:
 
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
+        mock_jira.update_issue.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.update_issue.call_args[1]["comment"]
         assert "Rejected" in result
 
-    def test_execute_includes_investigation_context(self, mocker):
+    def test_execute_includes_investigation_context(self):
         """Test that investigation context is passed to Claude."""
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
@@ -70,9 +72,8 @@ class TestRecommendAction:
         assert "Root cause is Y" in context["investigation_section"]
         assert "## Prior Investigation" in context["investigation_section"]
 
-    def test_execute_without_investigation_context(self, mocker, caplog):
+    def test_execute_without_investigation_context(self, caplog):
         """Test that recommend works without investigation and logs debug message."""
-        import logging
         caplog.set_level(logging.DEBUG)
 
         mock_issue = MagicMock()
@@ -31,11 +31,11 @@ class TestSecurityReviewAction:
 
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
-        mock_jira.add_comment.assert_called_once()
-        assert "INVALID ISSUE TYPE" in mock_jira.add_comment.call_args[0][1]
+        mock_jira.update_issue.assert_called_once()
+        assert "INVALID ISSUE TYPE" in mock_jira.update_issue.call_args[1]["comment"]
         assert "Rejected" in result
 
-    def test_execute_reviews_pr(self, mocker):
+    def test_execute_reviews_pr(self):
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
         mock_issue.fields.summary = "Security review for auth changes"
@@ -87,12 +87,12 @@ class TestSecurityReviewAction:
         assert "Security Review" in comment
 
         # Verify Jira label removed
-        mock_jira.remove_label.assert_called_with("TEST-123", "ai-security-review")
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-security-review"]
 
         # Verify cleanup
         mock_github.cleanup.assert_called_once()
 
-    def test_execute_no_pr_found(self, mocker):
+    def test_execute_no_pr_found(self):
         mock_issue = MagicMock()
         mock_issue.key = "TEST-123"
         mock_issue.fields.summary = "Review something"
@@ -108,16 +108,78 @@ class TestSecurityReviewAction:
         result = action.execute(mock_issue, mock_jira, mock_github, mock_claude)
 
         # Should post error comment and remove label
-        mock_jira.add_comment.assert_called_once()
-        comment = mock_jira.add_comment.call_args[0][1]
+        mock_jira.update_issue.assert_called_once()
+        comment = mock_jira.update_issue.call_args[1]["comment"]
         assert "Could not find PR" in comment
 
-        mock_jira.remove_label.assert_called_with("TEST-123", "ai-security-review")
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-security-review"]
 
         # Should NOT clone or invoke Claude
         mock_github.clone_repo.assert_not_called()
         mock_claude.execute_with_template.assert_not_called()
 
+    def test_execute_skips_docs_only_pr(self):
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-123"
+        mock_issue.fields.description = "PR: https://github.com/owner/repo/pull/42"
+        mock_issue.fields.issuetype.name = "Story"
+
+        mock_jira = MagicMock()
+        mock_jira.get_comments.return_value = []
+        mock_github = MagicMock()
+        mock_github.get_pr_info.return_value = {
+            "head_branch": "docs/readme",
+            "base_branch": "main",
+            "changed_files": ["README.md", "docs/diagram.PNG"],
+            "title": "Update docs",
+            "body": "",
+        }
+        mock_claude = MagicMock()
+
+        action = SecurityReviewAction(prompts_dir="/tmp/prompts")
+        result = action.execute(mock_issue, mock_jira, mock_github, mock_claude)
+
+        assert "no code changes" in result
+        comment = mock_jira.update_issue.call_args[1]["comment"]
+        assert "SECURITY REVIEW SKIPPED" in comment
+        assert mock_jira.update_issue.call_args[1]["remove_labels"] == ["ai-security-review"]
+        mock_github.clone_repo.assert_not_called()
+        mock_github.prefetch_clone_cache.assert_not_called()
+        mock_claude.execute_with_template.assert_not_called()
+
+    @pytest.mark.parametrize("changed_files", [
+        ["README.md", "poetry.lock"],
+        ["requirements.txt"],
+        ["CMakeLists.txt"],
+    ])
+    def test_execute_reviews_dependency_changes(self, changed_files):
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-123"
+        mock_issue.fields.description = "PR: https://github.com/owner/repo/pull/42"
+        mock_issue.fields.issuetype.name = "Story"
+
+        mock_jira = MagicMock()
+        mock_jira.get_comments.return_value = []
+        mock_github = MagicMock()
+        mock_github.get_pr_info.return_value = {
+            "head_branch": "deps/bump",
+            "base_branch": "main",
+            "changed_files": changed_files,
+            "title": "Bump dependencies",
+            "body": "",
+        }
+        mock_github.clone_repo.return_value = "/tmp/work-dir"
+        mock_claude = MagicMock()
+        mock_claude.execute_with_template.return_value = ClaudeResult(
+            content="No issues.", cost_usd=0.01, duration_ms=1000, session_id="s"
+        )
+
+        action = SecurityReviewAction(prompts_dir="/tmp/prompts")
+        action.execute(mock_issue, mock_jira, mock_github, mock_claude)
+
+        mock_github.clone_repo.assert_called_once_with(branch="deps/bump")
+        mock_claude.execute_with_template.assert_called_once()
+
 
 class TestSecurityReviewPRInComments:
     """Tests for finding PR in comments."""
@@ -183,6 +245,6 @@ class TestSecurityReviewPRInComments:
 
         action.execute(mock_issue, mock_jira_client, mock_github_client, mock_claude_executor)
 
-        call_args = mock_jira_client.add_comment.call_args
-        error_message = call_args[0][1]
+        call_args = mock_jira_client.update_issue.call_args
+        error_message = call_args[1]["comment"]
         assert "comments" in error_message.lower()
@@ -0,0 +1,37 @@
+"""Tests for changed-files prompt formatting."""
+
+from alm_orchestrator.utils.changed_files import format_changed_files
+
+
+class TestFormatChangedFiles:
+    """Tests for format_changed_files function."""
+
+    def test_short_list_is_not_rolled_up(self):
+        files = [f"src/module_{i}.py" for i in range(10)]
+
+        result = format_changed_files(files, max_lines=20)
+
+        assert result.splitlines() == [f"- {f}" for f in files]
+
+    def test_long_list_rolls_up_busy_directories(self):
+        files = [f"src/gen/file_{i}.py" for i in range(30)] + ["README.md", "src/app.py"]
+
+        result = format_changed_files(files, max_lines=20)
+
+        assert result.splitlines() == [
+            "- src/gen/ (30 files)",
+            "- README.md",
+            "- src/app.py",
+        ]
+
+    def test_rolled_up_list_is_truncated(self):
+        files = [f"dir_{i}/file.py" for i in range(30)]
+
+        result = format_changed_files(files, max_lines=10)
+
+        lines = result.splitlines()
+        assert len(lines) == 11
+        assert lines[-1] == "- ... and 20 more entries"
+
+    def test_empty_list(self):
+        assert format_changed_files([]) == ""
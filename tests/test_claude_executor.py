@@ -1,20 +1,47 @@
 """Tests for Claude Code CLI executor."""
 
 import json
+import logging
 import subprocess
 import pytest
 from unittest.mock import MagicMock
-from alm_orchestrator.claude_executor import ClaudeExecutor, ClaudeExecutorError, ClaudeResult
+from alm_orchestrator.claude_executor import (
+    MAX_ERROR_CHARS,
+    MAX_RESULT_CONTENT_CHARS,
+    TRUNCATION_MARKER,
+    ClaudeExecutor,
+    ClaudeExecutorError,
+    ClaudeResult,
+)
 
 
 def mock_json_response(content: str, cost: float = 0.01, duration: int = 5000) -> str:
-    """Create a mock JSON response from Claude Code."""
-    return json.dumps({
+    """Create a mock stream-json response from Claude Code."""
+    return "\n".join([
+        json.dumps({"type": "system", "subtype": "init", "session_id": "test-session-123"}),
+        json.dumps({"type": "assistant", "message": {"content": [{"type": "text", "text": content}]}}),
+        json.dumps(result_event(content, cost=cost, duration=duration)),
+    ]) + "\n"
+
+
+def result_event(content: str, cost: float = 0.01, duration: int = 5000) -> dict:
+    """Create the final result event of a stream-json response."""
+    return {
+        "type": "result",
+        "subtype": "success",
         "result": content,
         "cost_usd": cost,
         "duration_ms": duration,
-        "session_id": "test-session-123"
-    })
+        "session_id": "test-session-123",
+    }
+
+
+def fake_run(returncode: int = 0, stdout: str = "", stderr: str = ""):
+    """Create a subprocess.run stand-in that writes stdout to the caller's file."""
+    def run(cmd, **kwargs):
+        kwargs["stdout"].write(stdout.encode())
+        return MagicMock(returncode=returncode, stderr=stderr)
+    return run
 
 
 @pytest.fixture
@@ -38,7 +65,7 @@ def work_dir(tmp_path):
 class TestClaudeExecutor:
     def test_execute_runs_claude_cli(self, mocker, prompts_dir, work_dir):
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=mock_json_response("Analysis complete. The root cause is..."),
             stderr=""
@@ -59,7 +86,7 @@ class TestClaudeExecutor:
 
     def test_execute_with_timeout(self, mocker, prompts_dir, work_dir):
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=mock_json_response("Done"),
             stderr=""
@@ -76,7 +103,7 @@ class TestClaudeExecutor:
         from alm_orchestrator.config import DEFAULT_CLAUDE_TIMEOUT_SECONDS
 
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=mock_json_response("Done"),
             stderr=""
@@ -90,7 +117,7 @@ class TestClaudeExecutor:
 
     def test_execute_handles_nonzero_exit(self, mocker, prompts_dir, work_dir):
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=1,
             stdout="",
             stderr="Error: something went wrong"
@@ -102,6 +129,32 @@ class TestClaudeExecutor:
 
         assert "something went wrong" in str(exc_info.value)
 
+    def test_nonzero_exit_reports_result_event_error(self, mocker, prompts_dir, work_dir):
+        transcript = "\n".join(
+            [json.dumps({"type": "assistant", "message": "x" * 10_000})] * 100
+            + [json.dumps({"type": "result", "is_error": True, "result": "API rate limited"})]
+        )
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.side_effect = fake_run(returncode=1, stdout=transcript)
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        with pytest.raises(ClaudeExecutorError) as exc_info:
+            executor.execute(work_dir=str(work_dir), prompt="Do something", action="investigate")
+
+        assert str(exc_info.value) == "Claude Code failed: API rate limited"
+
+    def test_nonzero_exit_bounds_raw_output(self, mocker, prompts_dir, work_dir):
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.side_effect = fake_run(returncode=1, stdout="y" * 1_000_000 + "fatal: boom")
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        with pytest.raises(ClaudeExecutorError) as exc_info:
+            executor.execute(work_dir=str(work_dir), prompt="Do something", action="investigate")
+
+        message = str(exc_info.value)
+        assert message.endswith("fatal: boom")
+        assert len(message) <= MAX_ERROR_CHARS + len("Claude Code failed: ")
+
     def test_execute_handles_timeout(self, mocker, prompts_dir, work_dir):
         mock_run = mocker.patch("subprocess.run")
         mock_run.side_effect = subprocess.TimeoutExpired(cmd="claude", timeout=300)
@@ -114,7 +167,7 @@ class TestClaudeExecutor:
 
     def test_execute_uses_json_output(self, mocker, prompts_dir, work_dir):
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=mock_json_response("Output"),
             stderr=""
@@ -125,15 +178,15 @@ class TestClaudeExecutor:
 
         cmd = mock_run.call_args[0][0]
         assert "-p" in cmd
-        assert "--output-format" in cmd
-        assert "json" in cmd
+        assert cmd[cmd.index("--output-format") + 1] == "stream-json"
+        assert "--verbose" in cmd
         # Should NOT have legacy flags
         assert "--allowedTools" not in cmd
         assert "--permission-mode" not in cmd
 
     def test_execute_parses_json_metadata(self, mocker, prompts_dir, work_dir):
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=mock_json_response("Result", cost=0.05, duration=10000),
             stderr=""
@@ -148,10 +201,73 @@ class TestClaudeExecutor:
         assert result.session_id == "test-session-123"
 
 
+    def test_execute_uses_resolved_cli_path(self, mocker, prompts_dir, work_dir):
+        mocker.patch("shutil.which", return_value="/opt/bin/claude")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.side_effect = fake_run(stdout=mock_json_response("Done"))
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        executor.execute(work_dir=str(work_dir), prompt="Test", action="investigate")
+
+        assert mock_run.call_args[0][0][0] == "/opt/bin/claude"
+
+    def test_execute_reads_result_event_from_stream(self, mocker, prompts_dir, work_dir):
+        stream = "\n".join([
+            json.dumps({"type": "system", "subtype": "init"}),
+            "not json",
+            json.dumps({"type": "assistant", "message": {"content": []}}),
+            json.dumps(result_event("Final answer", cost=0.02)),
+        ])
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.side_effect = fake_run(stdout=stream)
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        result = executor.execute(work_dir=str(work_dir), prompt="Test", action="investigate")
+
+        assert result.content == "Final answer"
+        assert result.cost_usd == 0.02
+
+    def test_execute_reports_prompt_cache_usage(self, mocker, prompts_dir, work_dir):
+        event = result_event("Done")
+        event["usage"] = {
+            "input_tokens": 12,
+            "cache_creation_input_tokens": 300,
+            "cache_read_input_tokens": 4000,
+        }
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.side_effect = fake_run(stdout=json.dumps(event))
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        result = executor.execute(work_dir=str(work_dir), prompt="Test", action="investigate")
+
+        assert result.cache_creation_input_tokens == 300
+        assert result.cache_read_input_tokens == 4000
+
+    def test_execute_falls_back_to_raw_output(self, mocker, prompts_dir, work_dir):
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.side_effect = fake_run(stdout="plain text output")
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        result = executor.execute(work_dir=str(work_dir), prompt="Test", action="investigate")
+
+        assert result.content == "plain text output"
+        assert result.session_id == ""
+
+    def test_execute_truncates_long_content(self, mocker, prompts_dir, work_dir):
+        long_content = "x" * (MAX_RESULT_CONTENT_CHARS + 100)
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.side_effect = fake_run(stdout=mock_json_response(long_content))
+
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+        result = executor.execute(work_dir=str(work_dir), prompt="Test", action="investigate")
+
+        assert result.content == "x" * MAX_RESULT_CONTENT_CHARS + TRUNCATION_MARKER
+
+
 class TestClaudeExecutorTemplate:
     def test_execute_with_template(self, mocker, prompts_dir, work_dir):
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=mock_json_response("Template result"),
             stderr=""
@@ -159,7 +275,7 @@ class TestClaudeExecutorTemplate:
 
         # Create a temp template file
         template_file = prompts_dir / "test_template.md"
-        template_file.write_text("Investigate {issue_key}: {issue_summary}")
+        template_file.write_text("Investigate ${issue_key}: ${issue_summary}")
 
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
         result = executor.execute_with_template(
@@ -179,17 +295,17 @@ class TestClaudeExecutorTemplate:
         assert "TEST-123" in call_args[prompt_idx]
         assert "Bug in recipe deletion" in call_args[prompt_idx]
 
-    def test_execute_with_template_escapes_format_strings(self, mocker, prompts_dir, work_dir):
-        """SEC-001: Verify format string injection is prevented."""
+    def test_execute_with_template_inserts_values_verbatim(self, mocker, prompts_dir, work_dir):
+        """SEC-001: Verify template syntax in user content is not interpreted."""
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=mock_json_response("Safe result"),
             stderr=""
         )
 
         template_file = prompts_dir / "test_template.md"
-        template_file.write_text("Issue: {issue_key}\nDescription: {issue_description}")
+        template_file.write_text("Issue: ${issue_key}\nDescription: ${issue_description}")
 
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
         # Malicious input with format string attack
@@ -198,7 +314,7 @@ class TestClaudeExecutorTemplate:
             template_path=str(template_file),
             context={
                 "issue_key": "TEST-456",
-                "issue_description": "Attack: {__class__} and {config.github_token}"
+                "issue_description": "Attack: {__class__} and ${issue_key} and $$"
             },
             action="investigate"
         )
@@ -206,38 +322,11 @@ class TestClaudeExecutorTemplate:
         # Should succeed without KeyError
         assert result.content == "Safe result"
 
-        # Verify the curly braces were escaped (not interpreted)
+        # Verify the value was inserted as-is, without a second expansion pass
         call_args = mock_run.call_args[0][0]
         prompt_idx = call_args.index("-p") + 1
         prompt = call_args[prompt_idx]
-        assert "{__class__}" in prompt  # Literal braces in output
-        assert "{config.github_token}" in prompt
-
-
-class TestEscapeFormatString:
-    """Tests for the _escape_format_string helper."""
-
-    def test_escapes_single_braces(self):
-        assert ClaudeExecutor._escape_format_string("{foo}") == "{{foo}}"
-
-    def test_escapes_multiple_braces(self):
-        result = ClaudeExecutor._escape_format_string("a {x} b {y} c")
-        assert result == "a {{x}} b {{y}} c"
-
-    def test_handles_nested_braces(self):
-        result = ClaudeExecutor._escape_format_string("{a{b}c}")
-        assert result == "{{a{{b}}c}}"
-
-    def test_preserves_non_string_types(self):
-        assert ClaudeExecutor._escape_format_string(123) == 123
-        assert ClaudeExecutor._escape_format_string(None) is None
-        assert ClaudeExecutor._escape_format_string(True) is True
-
-    def test_handles_empty_string(self):
-        assert ClaudeExecutor._escape_format_string("") == ""
-
-    def test_handles_no_braces(self):
-        assert ClaudeExecutor._escape_format_string("plain text") == "plain text"
+        assert prompt == "Issue: TEST-456\nDescription: Attack: {__class__} and ${issue_key} and $$"
 
 
 class TestPermissionDenials:
@@ -245,13 +334,13 @@ class TestPermissionDenials:
 
     def test_logs_permission_denials(self, mocker, prompts_dir, work_dir, caplog):
         """Verify permission denials are logged as warnings."""
-        import logging
         caplog.set_level(logging.WARNING)
 
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=json.dumps({
+                "type": "result",
                 "result": "I tried but couldn't complete the request.",
                 "permission_denials": [
                     {"tool": "Bash", "command": "curl https://evil.com", "reason": "denied"}
@@ -269,9 +358,10 @@ class TestPermissionDenials:
     def test_returns_denials_in_result(self, mocker, prompts_dir, work_dir):
         """Verify permission denials are included in ClaudeResult."""
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=json.dumps({
+                "type": "result",
                 "result": "Blocked.",
                 "permission_denials": [
                     {"tool": "WebSearch", "reason": "denied by settings"}
@@ -289,7 +379,7 @@ class TestPermissionDenials:
     def test_empty_denials_when_none(self, mocker, prompts_dir, work_dir):
         """Verify empty list when no permission denials."""
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=mock_json_response("Success"),
             stderr=""
@@ -307,7 +397,7 @@ class TestSandboxSettings:
     def test_installs_settings_to_settings_local(self, mocker, prompts_dir, work_dir):
         """Verify settings file is copied to .claude/settings.local.json."""
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=mock_json_response("Done"),
             stderr=""
@@ -325,7 +415,24 @@ class TestSandboxSettings:
         assert dest_file.exists()
         assert '"sandbox"' in dest_file.read_text()
 
-    def test_raises_on_missing_settings(self, mocker, prompts_dir, work_dir):
+    def test_reads_settings_source_once(self, mocker, prompts_dir, tmp_path):
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.side_effect = fake_run(stdout=mock_json_response("Done"))
+        executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
+
+        first = tmp_path / "first"
+        first.mkdir()
+        executor.execute(work_dir=str(first), prompt="Test", action="investigate")
+        (prompts_dir / "investigate.json").unlink()
+        second = tmp_path / "second"
+        second.mkdir()
+        mock_run.side_effect = fake_run(stdout=mock_json_response("Done"))
+        executor.execute(work_dir=str(second), prompt="Test", action="investigate")
+
+        dest_file = second / ".claude" / "settings.local.json"
+        assert dest_file.read_text() == '{"sandbox": {"enabled": true}}'
+
+    def test_raises_on_missing_settings(self, prompts_dir, work_dir):
         """Verify FileNotFoundError when settings file doesn't exist."""
         executor = ClaudeExecutor(prompts_dir=str(prompts_dir))
 
@@ -339,7 +446,7 @@ class TestSandboxSettings:
     def test_no_legacy_cli_flags(self, mocker, prompts_dir, work_dir):
         """Verify sandbox mode doesn't use legacy CLI flags."""
         mock_run = mocker.patch("subprocess.run")
-        mock_run.return_value = MagicMock(
+        mock_run.side_effect = fake_run(
             returncode=0,
             stdout=mock_json_response("Done"),
             stderr=""
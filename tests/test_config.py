@@ -2,15 +2,24 @@ import os
 import pytest
 from alm_orchestrator.config import Config, ConfigError
 
+REQUIRED_ENV = {
+    "JIRA_URL": "https://test.atlassian.net",
+    "JIRA_CLIENT_ID": "test-client-id",
+    "JIRA_CLIENT_SECRET": "test-client-secret",
+    "JIRA_PROJECT_KEY": "TEST",
+    "GITHUB_TOKEN": "ghp_test",
+    "GITHUB_REPO": "owner/repo",
+}
+
+
+def set_required_env(monkeypatch, **overrides):
+    for key, value in {**REQUIRED_ENV, **overrides}.items():
+        monkeypatch.setenv(key, value)
+
 
 class TestConfig:
     def test_loads_from_environment(self, monkeypatch):
-        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
-        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
-        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
-        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
-        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
-        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        set_required_env(monkeypatch)
         monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
 
         config = Config.from_env()
@@ -26,12 +35,7 @@ class TestConfig:
         assert config.claude_timeout_seconds == 600  # default
 
     def test_custom_poll_interval(self, monkeypatch):
-        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
-        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
-        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
-        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
-        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
-        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        set_required_env(monkeypatch)
         monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
         monkeypatch.setenv("POLL_INTERVAL_SECONDS", "10")
 
@@ -40,12 +44,7 @@ class TestConfig:
         assert config.poll_interval_seconds == 10
 
     def test_custom_claude_timeout(self, monkeypatch):
-        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
-        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
-        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
-        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
-        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
-        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        set_required_env(monkeypatch)
         monkeypatch.setenv("CLAUDE_TIMEOUT_SECONDS", "900")
 
         config = Config.from_env()
@@ -53,12 +52,7 @@ class TestConfig:
         assert config.claude_timeout_seconds == 900
 
     def test_invalid_claude_timeout_raises_error(self, monkeypatch):
-        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
-        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
-        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
-        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
-        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
-        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        set_required_env(monkeypatch)
         monkeypatch.setenv("CLAUDE_TIMEOUT_SECONDS", "not-a-number")
 
         with pytest.raises(ConfigError) as exc_info:
@@ -68,8 +62,7 @@ class TestConfig:
 
     def test_raises_on_missing_required(self, monkeypatch):
         # Clear all env vars
-        for key in ["JIRA_URL", "JIRA_CLIENT_ID", "JIRA_CLIENT_SECRET", "JIRA_PROJECT_KEY",
-                    "GITHUB_TOKEN", "GITHUB_REPO"]:
+        for key in REQUIRED_ENV:
             monkeypatch.delenv(key, raising=False)
 
         with pytest.raises(ConfigError) as exc_info:
@@ -78,12 +71,7 @@ class TestConfig:
         assert "JIRA_URL" in str(exc_info.value)
 
     def test_repo_owner_and_name_parsing(self, monkeypatch):
-        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
-        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
-        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
-        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
-        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
-        monkeypatch.setenv("GITHUB_REPO", "acme-corp/recipe-api")
+        set_required_env(monkeypatch, GITHUB_REPO="acme-corp/recipe-api")
         monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
 
         config = Config.from_env()
@@ -92,14 +80,64 @@ class TestConfig:
         assert config.github_repo_name == "recipe-api"
 
     def test_anthropic_api_key_is_optional(self, monkeypatch):
-        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
-        monkeypatch.setenv("JIRA_CLIENT_ID", "test-client-id")
-        monkeypatch.setenv("JIRA_CLIENT_SECRET", "test-client-secret")
-        monkeypatch.setenv("JIRA_PROJECT_KEY", "TEST")
-        monkeypatch.setenv("GITHUB_TOKEN", "ghp_test")
-        monkeypatch.setenv("GITHUB_REPO", "owner/repo")
+        set_required_env(monkeypatch)
         monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
 
         config = Config.from_env()
 
         assert config.anthropic_api_key is None
+
+    def test_webhook_port_defaults_to_disabled(self, monkeypatch):
+        set_required_env(monkeypatch)
+        monkeypatch.delenv("WEBHOOK_PORT", raising=False)
+
+        config = Config.from_env()
+
+        assert config.webhook_port is None
+
+    def test_webhook_port_lengthens_default_poll_interval(self, monkeypatch):
+        set_required_env(monkeypatch)
+        monkeypatch.setenv("WEBHOOK_PORT", "8080")
+        monkeypatch.delenv("POLL_INTERVAL_SECONDS", raising=False)
+
+        config = Config.from_env()
+
+        assert config.webhook_port == 8080
+        assert config.poll_interval_seconds == 900
+
+    def test_max_poll_interval_default_and_override(self, monkeypatch):
+        set_required_env(monkeypatch)
+        monkeypatch.delenv("MAX_POLL_INTERVAL_SECONDS", raising=False)
+
+        assert Config.from_env().max_poll_interval_seconds == 3600
+
+        monkeypatch.setenv("MAX_POLL_INTERVAL_SECONDS", "1800")
+
+        assert Config.from_env().max_poll_interval_seconds == 1800
+
+    def test_invalid_max_poll_interval_raises_error(self, monkeypatch):
+        set_required_env(monkeypatch)
+        monkeypatch.setenv("MAX_POLL_INTERVAL_SECONDS", "forever")
+
+        with pytest.raises(ConfigError) as exc_info:
+            Config.from_env()
+
+        assert "MAX_POLL_INTERVAL_SECONDS must be an integer" in str(exc_info.value)
+
+    def test_invalid_webhook_port_raises_error(self, monkeypatch):
+        set_required_env(monkeypatch)
+        monkeypatch.setenv("WEBHOOK_PORT", "not-a-port")
+
+        with pytest.raises(ConfigError) as exc_info:
+            Config.from_env()
+
+        assert "WEBHOOK_PORT must be an integer" in str(exc_info.value)
+
+    def test_invalid_max_concurrent_actions_raises_error(self, monkeypatch):
+        set_required_env(monkeypatch)
+        monkeypatch.setenv("MAX_CONCURRENT_ACTIONS", "0")
+
+        with pytest.raises(ConfigError) as exc_info:
+            Config.from_env()
+
+        assert "MAX_CONCURRENT_ACTIONS must be at least 1" in str(exc_info.value)
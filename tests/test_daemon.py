@@ -1,5 +1,9 @@
 """Tests for main daemon loop."""
 
+import asyncio
+import dataclasses
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 from alm_orchestrator.daemon import Daemon
@@ -32,6 +36,19 @@ class TestDaemon:
         assert daemon is not None
         assert daemon._running is False
 
+    def test_initialization_resolves_prompts_dir(self, mock_config, mocker, monkeypatch, tmp_path):
+        mocker.patch("alm_orchestrator.daemon.JiraClient")
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mock_claude_class = mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mock_discover = mocker.patch("alm_orchestrator.daemon.discover_actions")
+        monkeypatch.chdir(tmp_path)
+
+        Daemon(mock_config, prompts_dir="prompts")
+
+        expected = str(tmp_path / "prompts")
+        mock_discover.assert_called_once_with(expected)
+        assert mock_claude_class.call_args[1]["prompts_dir"] == expected
+
     def test_single_poll_processes_issues(self, mock_config, mocker):
         mock_jira = MagicMock()
         mock_github = MagicMock()
@@ -49,12 +66,11 @@ class TestDaemon:
 
         mock_action = MagicMock()
         mock_router = MagicMock()
-        mock_router.has_action.return_value = True
-        mock_router.get_action.return_value = mock_action
+        mock_router.find_action.return_value = mock_action
         mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
 
         daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
-        processed = daemon.poll_once()
+        processed = asyncio.run(daemon.poll_once())
 
         # Verify action was executed
         mock_action.execute.assert_called_once()
@@ -76,18 +92,19 @@ class TestDaemon:
         mocker.patch("alm_orchestrator.daemon.ClaudeExecutor", return_value=mock_claude)
 
         mock_router = MagicMock()
-        mock_router.has_action.return_value = True
         mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
 
         daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
-        daemon.poll_once()
+        asyncio.run(daemon.poll_once())
 
-        # Verify original label removed, processing label added, then processing label removed
-        remove_calls = mock_jira.remove_label.call_args_list
-        assert len(remove_calls) == 2
-        assert remove_calls[0] == mocker.call("TEST-123", "ai-investigate")
-        assert remove_calls[1] == mocker.call("TEST-123", "ai-processing")
-        mock_jira.add_label.assert_called_once_with("TEST-123", "ai-processing")
+        # Verify original label swapped for processing label, then processing label removed
+        mock_jira.update_issue.assert_called_once_with(
+            "TEST-123",
+            remove_labels=["ai-investigate"],
+            add_labels=["ai-processing"],
+        )
+        mock_jira.remove_label.assert_called_once_with("TEST-123", "ai-processing")
+        mock_jira.add_label.assert_not_called()
 
     def test_poll_handles_action_error(self, mock_config, mocker):
         mock_jira = MagicMock()
@@ -107,12 +124,11 @@ class TestDaemon:
         mock_action = MagicMock()
         mock_action.execute.side_effect = Exception("Action failed")
         mock_router = MagicMock()
-        mock_router.has_action.return_value = True
-        mock_router.get_action.return_value = mock_action
+        mock_router.find_action.return_value = mock_action
         mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
 
         daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
-        processed = daemon.poll_once()
+        processed = asyncio.run(daemon.poll_once())
 
         # Should post error comment
         mock_jira.add_comment.assert_called()
@@ -120,11 +136,13 @@ class TestDaemon:
         assert "Failed" in comment
         assert "Action failed" in comment
 
-        # Original label removed upfront, processing label removed in finally
-        remove_calls = mock_jira.remove_label.call_args_list
-        assert len(remove_calls) == 2
-        assert remove_calls[0] == mocker.call("TEST-123", "ai-investigate")
-        assert remove_calls[1] == mocker.call("TEST-123", "ai-processing")
+        # Original label swapped upfront, processing label removed in finally
+        mock_jira.update_issue.assert_called_once_with(
+            "TEST-123",
+            remove_labels=["ai-investigate"],
+            add_labels=["ai-processing"],
+        )
+        mock_jira.remove_label.assert_called_once_with("TEST-123", "ai-processing")
 
     def test_run_can_be_stopped(self, mock_config, mocker):
         mock_jira = MagicMock()
@@ -143,6 +161,404 @@ class TestDaemon:
 
         mock_jira.fetch_issues_with_ai_labels.side_effect = stop_after_poll
 
-        daemon.run()
+        asyncio.run(daemon.run())
 
         assert daemon._running is False
+
+    def test_kick_triggers_immediate_poll(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mocker.patch("alm_orchestrator.daemon.discover_actions")
+
+        config = dataclasses.replace(mock_config, poll_interval_seconds=60)
+        daemon = Daemon(config, prompts_dir="/tmp/prompts")
+
+        def kick_then_stop(*args):
+            if mock_jira.fetch_issues_with_ai_labels.call_count == 1:
+                daemon.kick()
+            else:
+                daemon.stop()
+            return []
+
+        mock_jira.fetch_issues_with_ai_labels.side_effect = kick_then_stop
+
+        asyncio.run(asyncio.wait_for(daemon.run(), timeout=5))
+
+        assert mock_jira.fetch_issues_with_ai_labels.call_count == 2
+
+    def test_poll_interval_backs_off_while_idle(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.daemon.JiraClient")
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mocker.patch("alm_orchestrator.daemon.discover_actions")
+
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        daemon._webhook = MagicMock()
+
+        assert daemon._next_poll_interval(30, 0) == 30
+        assert daemon._next_poll_interval(30, 1) == 30
+        assert daemon._next_poll_interval(30, 2) == 60
+        assert daemon._next_poll_interval(30, 3) == 120
+        assert daemon._next_poll_interval(30, 100) == mock_config.max_poll_interval_seconds
+        # A configured interval above the ceiling is never shortened
+        assert daemon._next_poll_interval(7200, 5) == 7200
+
+    def _run_idle_polls(self, daemon, mock_jira, polls):
+        """Run the daemon for a number of empty polls, returning each wait."""
+        waits = []
+
+        async def record_wait(poll_interval):
+            waits.append(poll_interval)
+
+        def poll():
+            if mock_jira.fetch_issues_with_ai_labels.call_count >= polls:
+                daemon.stop()
+            return []
+
+        daemon._wait_for_next_poll = record_wait
+        mock_jira.fetch_issues_with_ai_labels.side_effect = poll
+        asyncio.run(asyncio.wait_for(daemon.run(), timeout=5))
+        return waits
+
+    def test_run_keeps_poll_interval_without_webhook(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mocker.patch("alm_orchestrator.daemon.discover_actions")
+
+        config = dataclasses.replace(mock_config, poll_interval_seconds=30)
+        daemon = Daemon(config, prompts_dir="/tmp/prompts")
+
+        assert self._run_idle_polls(daemon, mock_jira, 5) == [30] * 5
+
+    def test_run_backs_off_with_webhook(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mocker.patch("alm_orchestrator.daemon.discover_actions")
+        mock_webhook_class = mocker.patch("alm_orchestrator.daemon.WebhookServer")
+
+        config = dataclasses.replace(
+            mock_config, poll_interval_seconds=30, max_poll_interval_seconds=300, webhook_port=8080
+        )
+        daemon = Daemon(config, prompts_dir="/tmp/prompts")
+
+        assert self._run_idle_polls(daemon, mock_jira, 5) == [30, 60, 120, 240, 300]
+        mock_webhook_class.return_value.stop.assert_called_once()
+
+    def test_run_backs_off_with_default_webhook_config(self, mocker, monkeypatch):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mocker.patch("alm_orchestrator.daemon.discover_actions")
+        mocker.patch("alm_orchestrator.daemon.WebhookServer")
+        for key, value in {
+            "JIRA_URL": "https://test.atlassian.net",
+            "JIRA_CLIENT_ID": "test-client-id",
+            "JIRA_CLIENT_SECRET": "test-client-secret",
+            "JIRA_PROJECT_KEY": "TEST",
+            "GITHUB_TOKEN": "ghp_test",
+            "GITHUB_REPO": "owner/repo",
+            "WEBHOOK_PORT": "8080",
+        }.items():
+            monkeypatch.setenv(key, value)
+        monkeypatch.delenv("POLL_INTERVAL_SECONDS", raising=False)
+        monkeypatch.delenv("MAX_POLL_INTERVAL_SECONDS", raising=False)
+
+        daemon = Daemon(Config.from_env(), prompts_dir="/tmp/prompts")
+
+        assert self._run_idle_polls(daemon, mock_jira, 4) == [900, 1800, 3600, 3600]
+
+    def test_enqueued_issue_wakes_daemon(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mock_jira.fetch_issues_with_ai_labels.return_value = []
+        mock_jira.get_ai_labels.return_value = []
+        mock_issue = MagicMock()
+        mock_issue.fields.labels = []
+        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mock_jira_class.PROCESSING_LABEL = "ai-processing"
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mocker.patch("alm_orchestrator.daemon.discover_actions")
+
+        config = dataclasses.replace(mock_config, poll_interval_seconds=60)
+        daemon = Daemon(config, prompts_dir="/tmp/prompts")
+
+        def get_issue_then_stop(issue_key):
+            daemon.stop()
+            return mock_issue
+
+        def enqueue_after_poll():
+            # Deliver a webhook event while the daemon waits for the next poll
+            threading.Timer(0.05, daemon.enqueue_issue, ["TEST-123"]).start()
+            return []
+
+        mock_jira.get_issue.side_effect = get_issue_then_stop
+        mock_jira.fetch_issues_with_ai_labels.side_effect = enqueue_after_poll
+
+        asyncio.run(asyncio.wait_for(daemon.run(), timeout=5))
+
+        mock_jira.get_issue.assert_called_once_with("TEST-123")
+        assert mock_jira.fetch_issues_with_ai_labels.call_count == 1
+
+    def test_webhook_issue_processed_while_poll_action_runs(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        polled_issue = MagicMock()
+        polled_issue.key = "TEST-1"
+        webhook_issue = MagicMock()
+        webhook_issue.key = "TEST-2"
+        webhook_issue.fields.labels = ["ai-investigate"]
+        mock_jira.fetch_issues_with_ai_labels.return_value = [polled_issue]
+        mock_jira.get_issue.return_value = webhook_issue
+        mock_jira.get_ai_labels.return_value = ["ai-investigate"]
+
+        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mock_jira_class.PROCESSING_LABEL = "ai-processing"
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+
+        mock_action = MagicMock()
+        mock_router = MagicMock()
+        mock_router.find_action.return_value = mock_action
+        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+
+        config = dataclasses.replace(mock_config, poll_interval_seconds=60)
+        daemon = Daemon(config, prompts_dir="/tmp/prompts")
+        webhook_done = threading.Event()
+        handled_during_poll = []
+
+        def execute(issue, **kwargs):
+            if issue is webhook_issue:
+                webhook_done.set()
+                return
+            # The polled action stays busy until the webhook issue is handled
+            daemon.enqueue_issue("TEST-2")
+            handled_during_poll.append(webhook_done.wait(timeout=5))
+            daemon.stop()
+
+        mock_action.execute.side_effect = execute
+
+        asyncio.run(asyncio.wait_for(daemon.run(), timeout=10))
+
+        assert handled_during_poll == [True]
+        mock_jira.get_issue.assert_called_once_with("TEST-2")
+        assert mock_action.execute.call_count == 2
+
+    def test_process_pending_handles_webhook_issues(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-123"
+        mock_issue.fields.labels = ["ai-investigate"]
+        mock_jira.get_issue.return_value = mock_issue
+        mock_jira.get_ai_labels.return_value = ["ai-investigate"]
+
+        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mock_jira_class.PROCESSING_LABEL = "ai-processing"
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+
+        mock_action = MagicMock()
+        mock_router = MagicMock()
+        mock_router.find_action.return_value = mock_action
+        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        daemon.enqueue_issue("TEST-123")
+        processed = asyncio.run(daemon.process_pending())
+
+        mock_jira.get_issue.assert_called_once_with("TEST-123")
+        mock_action.execute.assert_called_once()
+        assert processed == 1
+        assert asyncio.run(daemon.process_pending()) == 0
+
+    def test_process_pending_skips_issues_in_progress(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-123"
+        mock_issue.fields.labels = ["ai-investigate", "ai-processing"]
+        mock_jira.get_issue.return_value = mock_issue
+
+        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mock_jira_class.PROCESSING_LABEL = "ai-processing"
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mock_router = MagicMock()
+        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        daemon.enqueue_issue("TEST-123")
+        processed = asyncio.run(daemon.process_pending())
+
+        assert processed == 0
+        mock_router.find_action.assert_not_called()
+
+    def test_process_pending_continues_after_fetch_error(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-2"
+        mock_issue.fields.labels = ["ai-investigate"]
+        mock_jira.get_issue.side_effect = [Exception("Issue does not exist"), mock_issue]
+        mock_jira.get_ai_labels.return_value = ["ai-investigate"]
+
+        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mock_jira_class.PROCESSING_LABEL = "ai-processing"
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+
+        mock_action = MagicMock()
+        mock_router = MagicMock()
+        mock_router.find_action.return_value = mock_action
+        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        daemon.enqueue_issue("TEST-1")
+        daemon.enqueue_issue("TEST-2")
+        processed = asyncio.run(daemon.process_pending())
+
+        assert mock_jira.get_issue.call_count == 2
+        mock_action.execute.assert_called_once()
+        assert mock_action.execute.call_args[1]["issue"] is mock_issue
+        assert processed == 1
+
+    def test_process_pending_ignores_other_projects(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mock_jira_class.PROCESSING_LABEL = "ai-processing"
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mock_router = MagicMock()
+        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        daemon.enqueue_issue("OTHER-1")
+        daemon.enqueue_issue("TESTING-2")
+        processed = asyncio.run(daemon.process_pending())
+
+        assert processed == 0
+        mock_jira.get_issue.assert_not_called()
+        mock_router.find_action.assert_not_called()
+
+    def test_poll_processes_issues_concurrently(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        issues = []
+        for key in ("TEST-1", "TEST-2"):
+            issue = MagicMock()
+            issue.key = key
+            issues.append(issue)
+        mock_jira.fetch_issues_with_ai_labels.return_value = issues
+        mock_jira.get_ai_labels.return_value = ["ai-investigate"]
+
+        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mock_jira_class.PROCESSING_LABEL = "ai-processing"
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+
+        # Each action waits for the other; only completes if both run at once
+        barrier = threading.Barrier(2, timeout=5)
+        mock_action = MagicMock()
+        mock_action.execute.side_effect = lambda **kwargs: barrier.wait()
+        mock_router = MagicMock()
+        mock_router.find_action.return_value = mock_action
+        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        processed = asyncio.run(daemon.poll_once())
+
+        assert processed == 2
+        assert mock_action.execute.call_count == 2
+
+    def test_poll_limits_concurrency_to_pool_size(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        issues = []
+        for key in ("TEST-1", "TEST-2", "TEST-3"):
+            issue = MagicMock()
+            issue.key = key
+            issues.append(issue)
+        mock_jira.fetch_issues_with_ai_labels.return_value = issues
+        mock_jira.get_ai_labels.return_value = ["ai-investigate"]
+
+        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mock_jira_class.PROCESSING_LABEL = "ai-processing"
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+
+        lock = threading.Lock()
+        running = []
+        peak = []
+
+        def track(**kwargs):
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            threading.Event().wait(0.02)
+            with lock:
+                running.pop()
+
+        mock_action = MagicMock()
+        mock_action.execute.side_effect = track
+        mock_router = MagicMock()
+        mock_router.find_action.return_value = mock_action
+        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+
+        config = dataclasses.replace(mock_config, max_concurrent_actions=1)
+        daemon = Daemon(config, prompts_dir="/tmp/prompts")
+        processed = asyncio.run(daemon.poll_once())
+        daemon.close()
+
+        assert processed == 3
+        assert max(peak) == 1
+
+    def test_poll_skips_label_already_processed(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-123"
+        mock_issue.fields.updated = "2024-01-01T00:00:00.000+0000"
+        mock_jira.fetch_issues_with_ai_labels.return_value = [mock_issue]
+        mock_jira.get_ai_labels.return_value = ["ai-investigate"]
+
+        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mock_jira_class.PROCESSING_LABEL = "ai-processing"
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mock_action = MagicMock()
+        mock_router = MagicMock()
+        mock_router.find_action.return_value = mock_action
+        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        # Second poll sees a stale search result that still has the label
+        asyncio.run(daemon.poll_once())
+        processed = asyncio.run(daemon.poll_once())
+
+        assert processed == 0
+        mock_action.execute.assert_called_once()
+
+    def test_poll_reprocesses_label_readded_after_update(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-123"
+        mock_issue.fields.updated = "2024-01-01T00:00:00.000+0000"
+        mock_jira.fetch_issues_with_ai_labels.return_value = [mock_issue]
+        mock_jira.get_ai_labels.return_value = ["ai-investigate"]
+
+        mock_jira_class = mocker.patch("alm_orchestrator.daemon.JiraClient", return_value=mock_jira)
+        mock_jira_class.PROCESSING_LABEL = "ai-processing"
+        mocker.patch("alm_orchestrator.daemon.GitHubClient")
+        mocker.patch("alm_orchestrator.daemon.ClaudeExecutor")
+        mock_action = MagicMock()
+        mock_router = MagicMock()
+        mock_router.find_action.return_value = mock_action
+        mocker.patch("alm_orchestrator.daemon.discover_actions", return_value=mock_router)
+
+        daemon = Daemon(mock_config, prompts_dir="/tmp/prompts")
+        asyncio.run(daemon.poll_once())
+        mock_issue.fields.updated = "2024-01-01T00:05:00.000+0000"
+        processed = asyncio.run(daemon.poll_once())
+
+        assert processed == 1
+        assert mock_action.execute.call_count == 2
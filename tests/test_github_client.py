@@ -1,8 +1,11 @@
+import dataclasses
 import os
+import subprocess
 import tempfile
+import threading
 import pytest
 from unittest.mock import MagicMock
-from alm_orchestrator.github_client import GitHubClient
+from alm_orchestrator.github_client import PR_INFO_CACHE_TTL_SECONDS, GitHubClient
 from alm_orchestrator.config import Config
 
 
@@ -52,6 +55,196 @@ class TestGitHubClient:
         assert "git" in clone_call[0][0]
         assert "clone" in clone_call[0][0]
 
+    def test_clone_repo_without_cache_is_shallow(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+
+        client = GitHubClient(mock_config)
+        client.clone_repo()
+
+        assert mock_run.call_count == 1
+        clone_cmd = mock_run.call_args_list[0][0][0]
+        assert "--depth" in clone_cmd
+        assert "--reference" not in clone_cmd
+
+    def test_clone_repo_fetches_only_requested_branch(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+
+        client = GitHubClient(mock_config)
+        client.clone_repo(branch="feature/x")
+
+        clone_cmd = mock_run.call_args_list[0][0][0]
+        assert "--single-branch" in clone_cmd
+        assert "--no-tags" in clone_cmd
+        assert clone_cmd[clone_cmd.index("--branch") + 1] == "feature/x"
+
+    def test_git_never_prompts_for_credentials(self, mock_config, mocker):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+
+        client = GitHubClient(mock_config)
+        client.clone_repo()
+
+        env = mock_run.call_args_list[0][1]["env"]
+        assert env["GIT_TERMINAL_PROMPT"] == "0"
+
+    def test_clone_repo_creates_cache_and_uses_reference(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+        config = dataclasses.replace(mock_config, github_clone_cache_dir=str(tmp_path / "cache"))
+
+        client = GitHubClient(config)
+        client.clone_repo(branch="main")
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        cache_dir = str(tmp_path / "cache" / "acme-corp-recipe-api.git")
+        assert commands[0] == ["git", "init", "--quiet", "--bare", cache_dir]
+        assert ["git", "-C", cache_dir, "config", "gc.auto", "0"] in commands
+        assert commands[-2][:4] == ["git", "-C", cache_dir, "fetch"]
+        assert commands[-2][-2:] == [client.get_authenticated_clone_url(), "+refs/heads/*:refs/heads/*"]
+        assert commands[-1][:4] == ["git", "clone", "--reference", cache_dir]
+        assert "--depth" not in commands[-1]
+
+    def test_clone_repo_fetches_existing_cache(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+        cache_dir = tmp_path / "acme-corp-recipe-api.git"
+        cache_dir.mkdir()
+        config = dataclasses.replace(mock_config, github_clone_cache_dir=str(tmp_path))
+
+        client = GitHubClient(config)
+        client.clone_repo()
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        assert commands[0] == ["git", "-C", str(cache_dir), "config", "--remove-section", "remote.origin"]
+        assert commands[1][:4] == ["git", "-C", str(cache_dir), "fetch"]
+        assert commands[1][-2:] == [client.get_authenticated_clone_url(), "+refs/heads/*:refs/heads/*"]
+        assert commands[2][:4] == ["git", "clone", "--reference", str(cache_dir)]
+
+    def test_clone_cache_never_stores_token(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+        config = dataclasses.replace(mock_config, github_clone_cache_dir=str(tmp_path / "cache"))
+
+        client = GitHubClient(config)
+        client.prefetch_clone_cache()
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        token_commands = [c for c in commands if any(config.github_token in arg for arg in c)]
+        assert [c[3] for c in token_commands] == ["fetch"]
+        assert "--no-write-fetch-head" in token_commands[0]
+
+    def test_clone_repo_reuses_recently_prefetched_cache(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mock_run = mocker.patch("subprocess.run")
+        (tmp_path / "acme-corp-recipe-api.git").mkdir()
+        config = dataclasses.replace(mock_config, github_clone_cache_dir=str(tmp_path))
+
+        client = GitHubClient(config)
+        client.prefetch_clone_cache()
+        client.clone_repo()
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        assert [c[3] for c in commands if c[:2] == ["git", "-C"]] == ["config", "fetch"]
+        assert commands[-1][:2] == ["git", "clone"]
+
+    def test_clone_cache_is_gc_after_many_fetches(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mocker.patch("alm_orchestrator.github_client.CLONE_CACHE_GC_INTERVAL_FETCHES", 2)
+        mock_run = mocker.patch("subprocess.run")
+        cache_dir = tmp_path / "acme-corp-recipe-api.git"
+        cache_dir.mkdir()
+        config = dataclasses.replace(mock_config, github_clone_cache_dir=str(tmp_path))
+
+        client = GitHubClient(config)
+        for _ in range(4):
+            client._cache_updated_at = None
+            client.prefetch_clone_cache()
+
+        commands = [c[0][0] for c in mock_run.call_args_list]
+        gc_runs = [c for c in commands if c[:4] == ["git", "-C", str(cache_dir), "gc"]]
+        assert len(gc_runs) == 2
+        assert commands.index(gc_runs[0]) == 3
+
+    def test_clone_cache_gc_waits_for_running_clones(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        cache_dir = tmp_path / "acme-corp-recipe-api.git"
+        cache_dir.mkdir()
+        config = dataclasses.replace(mock_config, github_clone_cache_dir=str(tmp_path))
+        clone_started = threading.Event()
+        finish_clone = threading.Event()
+        subcommands = []
+
+        def run(args, **kwargs):
+            subcommands.append(args[3] if args[:2] == ["git", "-C"] else args[1])
+            if args[1] == "clone":
+                clone_started.set()
+                finish_clone.wait(timeout=5)
+            return MagicMock(returncode=0)
+
+        mocker.patch("subprocess.run", side_effect=run)
+        client = GitHubClient(config)
+
+        def gc():
+            with client._cache_lock:
+                client._gc_clone_cache(str(cache_dir))
+
+        clone_thread = threading.Thread(target=client.clone_repo)
+        clone_thread.start()
+        assert clone_started.wait(timeout=5)
+        gc_thread = threading.Thread(target=gc)
+        gc_thread.start()
+        gc_thread.join(timeout=0.1)
+
+        assert gc_thread.is_alive()
+        assert "gc" not in subcommands
+
+        finish_clone.set()
+        clone_thread.join(timeout=5)
+        gc_thread.join(timeout=5)
+
+        assert subcommands[-2:] == ["clone", "gc"]
+
+    def test_clone_repo_falls_back_when_cache_update_fails(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        (tmp_path / "acme-corp-recipe-api.git").mkdir()
+        mock_run = mocker.patch("subprocess.run", side_effect=[
+            MagicMock(returncode=0),
+            subprocess.CalledProcessError(1, "git fetch"),
+            MagicMock(returncode=0),
+        ])
+        config = dataclasses.replace(mock_config, github_clone_cache_dir=str(tmp_path))
+
+        client = GitHubClient(config)
+        client.clone_repo()
+
+        clone_cmd = mock_run.call_args_list[-1][0][0]
+        assert "--depth" in clone_cmd
+        assert "--reference" not in clone_cmd
+
+    def test_clone_repo_falls_back_when_cache_dir_unwritable(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        mocker.patch("os.makedirs", side_effect=PermissionError("read-only file system"))
+        mock_run = mocker.patch("subprocess.run")
+        config = dataclasses.replace(mock_config, github_clone_cache_dir=str(tmp_path / "cache"))
+
+        client = GitHubClient(config)
+        client.clone_repo()
+
+        clone_cmd = mock_run.call_args_list[-1][0][0]
+        assert "--depth" in clone_cmd
+        assert "--reference" not in clone_cmd
+
+    def test_prefetch_tolerates_missing_git(self, mock_config, mocker, tmp_path):
+        mocker.patch("alm_orchestrator.github_client.Github")
+        (tmp_path / "acme-corp-recipe-api.git").mkdir()
+        mocker.patch("subprocess.run", side_effect=FileNotFoundError("git"))
+        config = dataclasses.replace(mock_config, github_clone_cache_dir=str(tmp_path))
+
+        client = GitHubClient(config)
+        client.prefetch_clone_cache()
+
     def test_create_branch(self, mock_config, mocker):
         mocker.patch("alm_orchestrator.github_client.Github")
         mock_run = mocker.patch("subprocess.run")
@@ -121,16 +314,17 @@ class TestGitHubClientPR:
     def test_add_pr_comment(self, mock_config, mocker):
         mock_github = MagicMock()
         mock_repo = MagicMock()
-        mock_pr = MagicMock()
-        mock_repo.get_pull.return_value = mock_pr
+        mock_issue = MagicMock()
+        mock_repo.get_issue.return_value = mock_issue
         mock_github.get_repo.return_value = mock_repo
         mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
 
         client = GitHubClient(mock_config)
         client.add_pr_comment(42, "## Code Review\n\nLooks good!")
 
-        mock_repo.get_pull.assert_called_once_with(42)
-        mock_pr.create_issue_comment.assert_called_once_with("## Code Review\n\nLooks good!")
+        mock_repo.get_issue.assert_called_once_with(42)
+        mock_issue.create_comment.assert_called_once_with("## Code Review\n\nLooks good!")
+        mock_repo.get_pull.assert_not_called()
 
     def test_get_pr_by_branch(self, mock_config, mocker):
         mock_github = MagicMock()
@@ -188,3 +382,54 @@ class TestGitHubClientPR:
         assert pr_info["title"] == "Add user authentication"
         assert pr_info["body"] == "This PR adds OAuth2 authentication to the API."
         mock_repo.get_pull.assert_called_once_with(42)
+
+    def test_get_pr_info_is_cached(self, mock_config, mocker):
+        mock_github = MagicMock()
+        mock_repo = mock_github.get_repo.return_value
+        mock_repo.get_pull.return_value.get_files.return_value = []
+        mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
+
+        client = GitHubClient(mock_config)
+        client.get_pr_info(42)
+        client.get_pr_info(42)
+        client.get_pr_info(43)
+
+        assert mock_repo.get_pull.call_count == 2
+
+    def test_pr_info_cache_evicts_expired_entries(self, mock_config, mocker):
+        mock_github = MagicMock()
+        mock_repo = mock_github.get_repo.return_value
+        mock_repo.get_pull.return_value.get_files.return_value = []
+        mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
+        mock_time = mocker.patch("alm_orchestrator.github_client.time")
+        mock_time.monotonic.return_value = 1000.0
+
+        client = GitHubClient(mock_config)
+        client.get_pr_info(1)
+        client.get_pr_info(2)
+        mock_time.monotonic.return_value = 1000.0 + PR_INFO_CACHE_TTL_SECONDS
+        client.get_pr_info(3)
+
+        assert list(client._pr_info_cache) == [3]
+
+    def test_pr_info_cache_is_bounded(self, mock_config, mocker):
+        mock_github = MagicMock()
+        mock_repo = mock_github.get_repo.return_value
+        mock_repo.get_pull.return_value.get_files.return_value = []
+        mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
+        mocker.patch("alm_orchestrator.github_client.PR_INFO_CACHE_MAX_ENTRIES", 2)
+
+        client = GitHubClient(mock_config)
+        for pr_number in (1, 2, 3):
+            client.get_pr_info(pr_number)
+
+        assert list(client._pr_info_cache) == [2, 3]
+
+    def test_close_releases_api_client(self, mock_config, mocker):
+        mock_github = MagicMock()
+        mocker.patch("alm_orchestrator.github_client.Github", return_value=mock_github)
+
+        client = GitHubClient(mock_config)
+        client.close()
+
+        mock_github.close.assert_called_once()
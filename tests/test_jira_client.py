@@ -1,5 +1,10 @@
+import dataclasses
+import gzip
+import json
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, MagicMock, patch
+from jira.exceptions import JIRAError
 from alm_orchestrator.jira_client import JiraClient, OAuthTokenManager
 from alm_orchestrator.config import Config
 
@@ -32,6 +37,32 @@ class TestJiraClient:
             token_auth="mock-access-token",
         )
 
+    def test_session_pool_sized_for_concurrent_actions(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+        config = dataclasses.replace(mock_config, max_concurrent_actions=16)
+
+        JiraClient(config)
+
+        prefix, adapter = mock_jira._session.mount.call_args[0]
+        assert prefix == "https://"
+        assert adapter._pool_maxsize == 16
+
+    def test_refreshed_token_reuses_client(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mock_jira_class = mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", side_effect=["token-1", "token-1", "token-2"])
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+
+        client = JiraClient(mock_config)
+        client._get_jira()
+        client._get_jira()
+
+        mock_jira_class.assert_called_once()
+        mock_jira._create_token_session.assert_called_once_with("token-2")
+
     def test_fetch_issues_with_ai_labels(self, mock_config, mocker):
         mock_jira = MagicMock()
         mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
@@ -55,6 +86,87 @@ class TestJiraClient:
         jql = call_args[0][0]
         assert "ai-investigate" in jql or "labels in" in jql
 
+    def test_fetch_issues_uses_stable_jql(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+        mock_jira.search_issues.return_value = []
+
+        client = JiraClient(mock_config)
+        client.fetch_issues_with_ai_labels()
+        client.fetch_issues_with_ai_labels()
+
+        first, second = (c[0][0] for c in mock_jira.search_issues.call_args_list)
+        assert first == second
+        labels_clause = ", ".join(f'"{label}"' for label in sorted(JiraClient.AI_LABELS))
+        assert f"labels in ({labels_clause})" in first
+
+    def test_fetch_issues_primes_comments_cache(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+
+        mock_comment = MagicMock()
+        mock_comment.body = "PR: #42"
+        mock_comment.created = "2024-01-01T10:00:00.000+0000"
+        mock_comment.author.accountId = "user-id"
+
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-123"
+        mock_issue.fields.comment.comments = [mock_comment]
+        mock_issue.fields.comment.total = 1
+        mock_jira.search_issues.return_value = [mock_issue]
+
+        client = JiraClient(mock_config)
+        client.fetch_issues_with_ai_labels()
+        comments = client.get_comments("TEST-123")
+
+        assert comments[0]["body"] == "PR: #42"
+        assert mock_jira.search_issues.call_args[1]["fields"] == JiraClient.SEARCH_FIELDS
+        mock_jira.issue.assert_not_called()
+
+    def test_fetch_issues_primed_cache_is_bounded(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+        mocker.patch.object(JiraClient, "COMMENTS_CACHE_MAX_ISSUES", 2)
+
+        issues = []
+        for key in ("TEST-1", "TEST-2", "TEST-3"):
+            issue = MagicMock()
+            issue.key = key
+            issue.fields.comment.comments = []
+            issue.fields.comment.total = 0
+            issues.append(issue)
+        mock_jira.search_issues.return_value = issues
+
+        client = JiraClient(mock_config)
+        client.fetch_issues_with_ai_labels()
+
+        assert list(client._comments_cache) == ["TEST-2", "TEST-3"]
+
+    def test_fetch_issues_skips_truncated_comments(self, mock_config, mocker):
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+
+        mock_issue = MagicMock()
+        mock_issue.key = "TEST-123"
+        mock_issue.fields.comment.comments = []
+        mock_issue.fields.comment.total = 75
+        mock_jira.search_issues.return_value = [mock_issue]
+        mock_jira.comments.return_value = []
+
+        client = JiraClient(mock_config)
+        client.fetch_issues_with_ai_labels()
+        client.get_comments("TEST-123")
+
+        mock_jira.comments.assert_called_once()
+
     def test_get_ai_labels_for_issue(self, mock_config, mocker):
         mock_jira = MagicMock()
         mock_myself = MagicMock()
@@ -114,19 +226,13 @@ class TestJiraClientUpdates:
         mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
         mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
 
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
-        mock_issue.fields.labels = ["bug"]
-        mock_jira.issue.return_value = mock_issue
-
         client = JiraClient(mock_config)
         client.add_label("TEST-123", "ai-processing")
 
-        mock_issue.update.assert_called_once()
-        update_call = mock_issue.update.call_args
-        new_labels = update_call[1]["fields"]["labels"]
-        assert "ai-processing" in new_labels
-        assert "bug" in new_labels
+        mock_jira._session.put.assert_called_once()
+        payload = json.loads(mock_jira._session.put.call_args[1]["data"])
+        assert payload == {"update": {"labels": [{"add": "ai-processing"}]}}
+        mock_jira.issue.assert_not_called()
 
     def test_add_comment(self, mock_config, mocker):
         mock_jira = MagicMock()
@@ -148,35 +254,28 @@ class TestJiraClientUpdates:
         mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
         mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
 
-        mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
-        mock_issue.fields.labels = ["ai-investigate", "bug", "priority-high"]
-        mock_jira.issue.return_value = mock_issue
-
         client = JiraClient(mock_config)
         client.remove_label("TEST-123", "ai-investigate")
 
-        # Should update issue with label removed
-        mock_issue.update.assert_called_once()
-        update_call = mock_issue.update.call_args
-        new_labels = update_call[1]["fields"]["labels"]
-        assert "ai-investigate" not in new_labels
-        assert "bug" in new_labels
-        assert "priority-high" in new_labels
+        # Removed server-side without reading the issue first
+        mock_jira._session.put.assert_called_once()
+        payload = json.loads(mock_jira._session.put.call_args[1]["data"])
+        assert payload == {"update": {"labels": [{"remove": "ai-investigate"}]}}
+        mock_jira.issue.assert_not_called()
 
-    def test_remove_label_not_present(self, mock_config, mocker):
+    def test_remove_label_falls_back_when_update_rejected(self, mock_config, mocker):
         mock_jira = MagicMock()
+        mock_jira._session.put.side_effect = JIRAError(status_code=400)
         mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
         mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
         mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
 
         mock_issue = MagicMock()
-        mock_issue.key = "TEST-123"
         mock_issue.fields.labels = ["bug"]
         mock_jira.issue.return_value = mock_issue
 
         client = JiraClient(mock_config)
-        # Should not raise, just no-op
+        # Label not present: no write needed
         client.remove_label("TEST-123", "ai-investigate")
 
         mock_issue.update.assert_not_called()
@@ -211,20 +310,22 @@ class TestJiraClientComments:
         mock_comment_3.created = "2024-01-03T10:00:00.000+0000"
         mock_comment_3.author.accountId = "author-3"
 
-        # Mock issue with comments in arbitrary order
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = [mock_comment_2, mock_comment_1, mock_comment_3]
-        mock_jira.issue.return_value = mock_issue
+        # Jira returns comments newest-first
+        mock_jira.comments.return_value = [mock_comment_3, mock_comment_2, mock_comment_1]
 
         client = JiraClient(mock_config)
         result = client.get_comments("TEST-123")
 
-        # Should be sorted newest-first and include metadata
+        # Should keep Jira's newest-first order and include metadata
         assert len(result) == 3
         assert result[0] == {"body": "Third comment", "author_id": "author-3", "created": "2024-01-03T10:00:00.000+0000"}
         assert result[1] == {"body": "Second comment", "author_id": "author-2", "created": "2024-01-02T10:00:00.000+0000"}
         assert result[2] == {"body": "First comment", "author_id": "author-1", "created": "2024-01-01T10:00:00.000+0000"}
-        mock_jira.issue.assert_called_once_with("TEST-123", fields="comment")
+        mock_jira.comments.assert_called_once_with(
+            "TEST-123",
+            max_results=JiraClient.COMMENTS_MAX_RESULTS,
+            order_by="-created",
+        )
 
     def test_get_comments_returns_empty_list_when_no_comments(self, mock_config, mocker):
         """Test that get_comments returns empty list when issue has no comments."""
@@ -236,15 +337,88 @@ class TestJiraClientComments:
         mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
         mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
 
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = []
-        mock_jira.issue.return_value = mock_issue
+        mock_jira.comments.return_value = []
 
         client = JiraClient(mock_config)
         result = client.get_comments("TEST-123")
 
         assert result == []
 
+    def test_get_comments_cached_across_header_lookups(self, mock_config, mocker):
+        """Investigation and recommendation lookups share one comments fetch."""
+        mock_jira = MagicMock()
+        mock_myself = MagicMock()
+        mock_myself.__getitem__ = lambda self, key: "bot-account-id" if key == "accountId" else None
+        mock_jira.myself.return_value = mock_myself
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+
+        mock_comment = MagicMock()
+        mock_comment.body = "RECOMMENDATIONS\n===============\n\nOption 1."
+        mock_comment.created = "2024-01-01T10:00:00.000+0000"
+        mock_comment.author.accountId = "bot-account-id"
+
+        mock_jira.comments.return_value = [mock_comment]
+
+        client = JiraClient(mock_config)
+        client.get_investigation_comment("TEST-123")
+        client.get_recommendation_comment("TEST-123")
+        client.get_comments("TEST-123")
+
+        mock_jira.comments.assert_called_once()
+
+    def test_add_comment_invalidates_comments_cache(self, mock_config, mocker):
+        """Adding a comment forces the next lookup to refetch."""
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+
+        mock_jira.comments.return_value = []
+
+        client = JiraClient(mock_config)
+        client.get_comments("TEST-123")
+        client.add_comment("TEST-123", "New comment")
+        client.get_comments("TEST-123")
+
+        assert mock_jira.comments.call_count == 2
+
+    def test_comments_cache_evicts_expired_entries(self, mock_config, mocker):
+        """Expired entries are dropped when new comments are cached."""
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+        mock_time = mocker.patch("alm_orchestrator.jira_client.time")
+        mock_time.monotonic.return_value = 1000.0
+
+        mock_jira.comments.return_value = []
+
+        client = JiraClient(mock_config)
+        client.get_comments("TEST-1")
+        client.get_comments("TEST-2")
+        mock_time.monotonic.return_value = 1000.0 + JiraClient.COMMENTS_CACHE_TTL_SECONDS
+        client.get_comments("TEST-3")
+
+        assert list(client._comments_cache) == ["TEST-3"]
+
+    def test_comments_cache_is_bounded(self, mock_config, mocker):
+        """The oldest entries are evicted once the cache is full."""
+        mock_jira = MagicMock()
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+        mocker.patch.object(JiraClient, "COMMENTS_CACHE_MAX_ISSUES", 2)
+
+        mock_jira.comments.return_value = []
+
+        client = JiraClient(mock_config)
+        for key in ("TEST-1", "TEST-2", "TEST-3"):
+            client.get_comments(key)
+
+        assert list(client._comments_cache) == ["TEST-2", "TEST-3"]
+
 
 class TestJiraClientInvestigation:
     """Tests for investigation comment retrieval."""
@@ -270,9 +444,7 @@ class TestJiraClientInvestigation:
         mock_comment.created = "2024-01-01T10:00:00.000+0000"
         mock_comment.author.accountId = "bot-account-id"
 
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = [mock_comment]
-        mock_jira.issue.return_value = mock_issue
+        mock_jira.comments.return_value = [mock_comment]
 
         client = JiraClient(mock_config)
         result = client.get_investigation_comment("TEST-123")
@@ -288,9 +460,7 @@ class TestJiraClientInvestigation:
         mock_comment.created = "2024-01-01T10:00:00.000+0000"
         mock_comment.author.accountId = "other-user"
 
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = [mock_comment]
-        mock_jira.issue.return_value = mock_issue
+        mock_jira.comments.return_value = [mock_comment]
 
         client = JiraClient(mock_config)
         result = client.get_investigation_comment("TEST-123")
@@ -306,9 +476,7 @@ class TestJiraClientInvestigation:
         mock_comment.created = "2024-01-01T10:00:00.000+0000"
         mock_comment.author.accountId = "imposter-account-id"
 
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = [mock_comment]
-        mock_jira.issue.return_value = mock_issue
+        mock_jira.comments.return_value = [mock_comment]
 
         client = JiraClient(mock_config)
         result = client.get_investigation_comment("TEST-123")
@@ -329,9 +497,7 @@ class TestJiraClientInvestigation:
         mock_comment_new.created = "2024-01-02T10:00:00.000+0000"
         mock_comment_new.author.accountId = "bot-account-id"
 
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = [mock_comment_old, mock_comment_new]
-        mock_jira.issue.return_value = mock_issue
+        mock_jira.comments.return_value = [mock_comment_new, mock_comment_old]
 
         client = JiraClient(mock_config)
         result = client.get_investigation_comment("TEST-123")
@@ -363,9 +529,7 @@ class TestJiraClientCommentByHeader:
         mock_comment.created = "2024-01-01T10:00:00.000+0000"
         mock_comment.author.accountId = "bot-account-id"
 
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = [mock_comment]
-        mock_jira.issue.return_value = mock_issue
+        mock_jira.comments.return_value = [mock_comment]
 
         client = JiraClient(mock_config)
         result = client.get_comment_by_header("TEST-123", "TEST HEADER")
@@ -381,9 +545,7 @@ class TestJiraClientCommentByHeader:
         mock_comment.created = "2024-01-01T10:00:00.000+0000"
         mock_comment.author.accountId = "bot-account-id"
 
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = [mock_comment]
-        mock_jira.issue.return_value = mock_issue
+        mock_jira.comments.return_value = [mock_comment]
 
         client = JiraClient(mock_config)
         result = client.get_comment_by_header("TEST-123", "TEST HEADER")
@@ -399,9 +561,7 @@ class TestJiraClientCommentByHeader:
         mock_comment.created = "2024-01-01T10:00:00.000+0000"
         mock_comment.author.accountId = "imposter-account-id"
 
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = [mock_comment]
-        mock_jira.issue.return_value = mock_issue
+        mock_jira.comments.return_value = [mock_comment]
 
         client = JiraClient(mock_config)
         result = client.get_comment_by_header("TEST-123", "TEST HEADER")
@@ -422,9 +582,7 @@ class TestJiraClientCommentByHeader:
         mock_comment_new.created = "2024-01-02T10:00:00.000+0000"
         mock_comment_new.author.accountId = "bot-account-id"
 
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = [mock_comment_old, mock_comment_new]
-        mock_jira.issue.return_value = mock_issue
+        mock_jira.comments.return_value = [mock_comment_new, mock_comment_old]
 
         client = JiraClient(mock_config)
         result = client.get_comment_by_header("TEST-123", "TEST HEADER")
@@ -440,11 +598,215 @@ class TestJiraClientCommentByHeader:
         mock_comment.created = "2024-01-01T10:00:00.000+0000"
         mock_comment.author.accountId = "bot-account-id"
 
-        mock_issue = MagicMock()
-        mock_issue.fields.comment.comments = [mock_comment]
-        mock_jira.issue.return_value = mock_issue
+        mock_jira.comments.return_value = [mock_comment]
 
         client = JiraClient(mock_config)
         result = client.get_recommendation_comment("TEST-123")
 
         assert result == "RECOMMENDATIONS\n===============\n\nOption 1: Do X."
+
+
+class TestOAuthTokenManager:
+    """Tests for OAuth token management over a pooled session."""
+
+    @pytest.fixture
+    def token_manager(self):
+        return OAuthTokenManager(
+            client_id="test-client-id",
+            client_secret="test-client-secret",
+            token_url="https://auth.atlassian.com/oauth/token",
+            resources_url="https://api.atlassian.com/oauth/token/accessible-resources",
+            api_url_pattern="https://api.atlassian.com/ex/jira/{cloud_id}",
+        )
+
+    def test_requests_reuse_session(self, token_manager, mocker):
+        token_response = MagicMock()
+        token_response.json.return_value = {"access_token": "token-1", "expires_in": 3600}
+        resources_response = MagicMock()
+        resources_response.json.return_value = [{"id": "cloud-123"}]
+        mock_post = mocker.patch.object(token_manager._session, "post", return_value=token_response)
+        mock_get = mocker.patch.object(token_manager._session, "get", return_value=resources_response)
+
+        assert token_manager.get_token() == "token-1"
+        assert token_manager.get_api_url() == "https://api.atlassian.com/ex/jira/cloud-123"
+
+        mock_post.assert_called_once()
+        mock_get.assert_called_once()
+
+    def test_concurrent_callers_refresh_once(self, token_manager, mocker):
+        token_response = MagicMock()
+        token_response.json.return_value = {"access_token": "token-1", "expires_in": 3600}
+        mock_post = mocker.patch.object(token_manager._session, "post", return_value=token_response)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            tokens = list(pool.map(lambda _: token_manager.get_token(), range(8)))
+
+        assert tokens == ["token-1"] * 8
+        mock_post.assert_called_once()
+
+    def test_cloud_id_survives_token_refresh(self, token_manager, mocker):
+        token_response = MagicMock()
+        token_response.json.side_effect = [
+            {"access_token": "token-1", "expires_in": 0},
+            {"access_token": "token-2", "expires_in": 3600},
+        ]
+        resources_response = MagicMock()
+        resources_response.json.return_value = [{"id": "cloud-123"}]
+        mocker.patch.object(token_manager._session, "post", return_value=token_response)
+        mock_get = mocker.patch.object(token_manager._session, "get", return_value=resources_response)
+
+        token_manager.get_token()
+        token_manager.get_cloud_id()
+        assert token_manager.get_token() == "token-2"
+        token_manager.get_cloud_id()
+
+        mock_get.assert_called_once()
+
+    def test_concurrent_callers_fetch_cloud_id_once(self, token_manager, mocker):
+        token_manager._access_token = "token-1"
+        resources_response = MagicMock()
+        resources_response.json.return_value = [{"id": "cloud-123"}]
+        mock_get = mocker.patch.object(token_manager._session, "get", return_value=resources_response)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            cloud_ids = list(pool.map(lambda _: token_manager.get_cloud_id(), range(8)))
+
+        assert cloud_ids == ["cloud-123"] * 8
+        mock_get.assert_called_once()
+
+    def test_session_mounts_retrying_adapter(self, token_manager):
+        adapter = token_manager._session.get_adapter("https://auth.atlassian.com/oauth/token")
+
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
+        # Token refreshes are POSTs and must be retried too
+        assert "POST" in adapter.max_retries.allowed_methods
+
+
+class TestJiraClientUpdateIssue:
+    """Tests for combined comment + label updates."""
+
+    @pytest.fixture
+    def mock_jira(self, mocker):
+        mock_jira = MagicMock()
+        mock_jira._get_url.side_effect = lambda path: f"https://api.example/rest/api/2/{path}"
+        mocker.patch("alm_orchestrator.jira_client.JIRA", return_value=mock_jira)
+        mocker.patch.object(OAuthTokenManager, "get_token", return_value="mock-access-token")
+        mocker.patch.object(OAuthTokenManager, "get_api_url", return_value="https://api.atlassian.com/ex/jira/mock-cloud-id")
+        return mock_jira
+
+    def test_update_issue_sends_single_put(self, mock_config, mock_jira):
+        client = JiraClient(mock_config)
+        client.update_issue("TEST-123", comment="Done.", remove_labels=["ai-fix"])
+
+        mock_jira._session.put.assert_called_once()
+        url = mock_jira._session.put.call_args[0][0]
+        payload = json.loads(mock_jira._session.put.call_args[1]["data"])
+        assert url == "https://api.example/rest/api/2/issue/TEST-123"
+        assert payload == {
+            "update": {
+                "comment": [{"add": {"body": "Done."}}],
+                "labels": [{"remove": "ai-fix"}],
+            }
+        }
+        mock_jira.issue.assert_not_called()
+        mock_jira.add_comment.assert_not_called()
+
+    def test_update_issue_swaps_labels(self, mock_config, mock_jira):
+        client = JiraClient(mock_config)
+        client.update_issue("TEST-123", remove_labels=["ai-fix"], add_labels=["ai-processing"])
+
+        mock_jira._session.put.assert_called_once()
+        payload = json.loads(mock_jira._session.put.call_args[1]["data"])
+        assert payload == {
+            "update": {"labels": [{"remove": "ai-fix"}, {"add": "ai-processing"}]}
+        }
+        mock_jira.issue.assert_not_called()
+
+    def test_update_issue_invalidates_comments_cache(self, mock_config, mock_jira):
+        mock_jira.comments.return_value = []
+
+        client = JiraClient(mock_config)
+        client.get_comments("TEST-123")
+        client.update_issue("TEST-123", comment="Done.")
+        client.get_comments("TEST-123")
+
+        assert mock_jira.comments.call_count == 2
+
+    def test_update_issue_noop_without_changes(self, mock_config, mock_jira):
+        client = JiraClient(mock_config)
+        client.update_issue("TEST-123")
+
+        mock_jira._session.put.assert_not_called()
+
+    def test_update_issue_falls_back_to_separate_calls_on_400(self, mock_config, mock_jira):
+        mock_jira._session.put.side_effect = JIRAError(status_code=400)
+        mock_issue = MagicMock()
+        mock_issue.fields.labels = ["ai-fix", "bug"]
+        mock_jira.issue.return_value = mock_issue
+
+        client = JiraClient(mock_config)
+        client.update_issue("TEST-123", comment="Done.", remove_labels=["ai-fix"])
+
+        mock_jira.add_comment.assert_called_once_with("TEST-123", "Done.")
+        mock_issue.update.assert_called_once_with(fields={"labels": ["bug"]})
+        mock_jira.issue.assert_called_once_with("TEST-123", fields="labels")
+
+    def test_update_issue_raises_other_errors(self, mock_config, mock_jira):
+        mock_jira._session.put.side_effect = JIRAError(status_code=500)
+
+        client = JiraClient(mock_config)
+        with pytest.raises(JIRAError):
+            client.update_issue("TEST-123", comment="Done.")
+
+        mock_jira.add_comment.assert_not_called()
+
+    def test_update_issue_gzips_large_bodies(self, mock_config, mock_jira):
+        comment = "x" * (JiraClient.GZIP_MIN_BYTES + 1)
+
+        client = JiraClient(mock_config)
+        client.update_issue("TEST-123", comment=comment)
+
+        kwargs = mock_jira._session.put.call_args[1]
+        assert kwargs["headers"] == {"Content-Encoding": "gzip"}
+        payload = json.loads(gzip.decompress(kwargs["data"]))
+        assert payload["update"]["comment"] == [{"add": {"body": comment}}]
+
+    def test_update_issue_small_bodies_not_compressed(self, mock_config, mock_jira):
+        client = JiraClient(mock_config)
+        client.update_issue("TEST-123", comment="Done.")
+
+        assert "headers" not in mock_jira._session.put.call_args[1]
+
+    def test_update_issue_falls_back_when_gzip_rejected(self, mock_config, mock_jira):
+        comment = "x" * (JiraClient.GZIP_MIN_BYTES + 1)
+        mock_jira._session.put.side_effect = [JIRAError(status_code=415), MagicMock(), MagicMock()]
+
+        client = JiraClient(mock_config)
+        client.update_issue("TEST-123", comment=comment)
+        client.update_issue("TEST-124", comment=comment)
+
+        calls = mock_jira._session.put.call_args_list
+        assert len(calls) == 3
+        assert json.loads(calls[1][1]["data"])["update"]["comment"] == [{"add": {"body": comment}}]
+        assert "headers" not in calls[1][1]
+        assert "headers" not in calls[2][1]
+
+    def test_update_issue_keeps_gzip_when_payload_rejected(self, mock_config, mock_jira):
+        """A 400 that the uncompressed retry also gets is not blamed on gzip."""
+        comment = "x" * (JiraClient.GZIP_MIN_BYTES + 1)
+        mock_jira._session.put.side_effect = [
+            JIRAError(status_code=400),
+            JIRAError(status_code=400),
+            MagicMock(),
+        ]
+
+        client = JiraClient(mock_config)
+        client.update_issue("TEST-123", comment=comment)
+        client.update_issue("TEST-124", comment=comment)
+
+        calls = mock_jira._session.put.call_args_list
+        assert len(calls) == 3
+        assert "headers" not in calls[1][1]
+        assert calls[2][1]["headers"] == {"Content-Encoding": "gzip"}
+        mock_jira.add_comment.assert_called_once_with("TEST-123", comment)
@@ -35,6 +35,10 @@ class TestExtractPrNumber:
     def test_returns_none_for_empty_string(self):
         assert extract_pr_number("") is None
 
+    def test_mixed_case_url_still_matches(self):
+        text = "Fixed in HTTPS://GITHUB.COM/Owner/Repo/PULL/77"
+        assert extract_pr_number(text) == 77
+
 
 class TestFindPrInTexts:
     """Tests for find_pr_in_texts function."""
@@ -63,3 +67,15 @@ class TestFindPrInTexts:
     def test_returns_none_for_empty_inputs(self):
         result = find_pr_in_texts("", [])
         assert result is None
+
+    def test_stops_reading_comments_after_match(self):
+        seen = []
+
+        def comments():
+            for body in ["PR #7", "PR #8"]:
+                seen.append(body)
+                yield body
+
+        result = find_pr_in_texts("No PR", comments())
+        assert result == 7
+        assert seen == ["PR #7"]
@@ -0,0 +1,48 @@
+"""Tests for prompt template loading."""
+
+import os
+from pathlib import Path
+
+import pytest
+from alm_orchestrator.prompts import load_prompt_template
+
+
+class TestLoadPromptTemplate:
+    def test_substitutes_placeholders(self, tmp_path):
+        template_file = tmp_path / "impact.md"
+        template_file.write_text("**${issue_key}**: $issue_summary")
+
+        template = load_prompt_template(str(template_file))
+
+        assert template.safe_substitute(issue_key="TEST-1", issue_summary="Bug") == "**TEST-1**: Bug"
+
+    def test_returns_cached_template(self, tmp_path):
+        template_file = tmp_path / "recommend.md"
+        template_file.write_text("${issue_key}")
+
+        assert load_prompt_template(str(template_file)) is load_prompt_template(str(template_file))
+
+    def test_caches_unchanged_file(self, tmp_path, mocker):
+        template_file = tmp_path / "fix.md"
+        template_file.write_text("original")
+        read_text = mocker.spy(Path, "read_text")
+
+        load_prompt_template(str(template_file))
+        load_prompt_template(str(template_file))
+
+        assert read_text.call_count == 1
+
+    def test_rereads_modified_file(self, tmp_path):
+        template_file = tmp_path / "implement.md"
+        template_file.write_text("original")
+        load_prompt_template(str(template_file))
+
+        template_file.write_text("changed")
+        stat = template_file.stat()
+        os.utime(template_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_prompt_template(str(template_file)).template == "changed"
+
+    def test_missing_template_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_prompt_template(str(tmp_path / "missing.md"))
@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import MagicMock
-from alm_orchestrator.router import LabelRouter, UnknownLabelError
+from alm_orchestrator.router import LabelRouter
 from alm_orchestrator.actions.base import BaseAction
 
 
@@ -27,16 +27,10 @@ class TestLabelRouter:
         action = MockAction()
 
         router.register("ai-investigate", action)
-        result = router.get_action("ai-investigate")
+        result = router.find_action("ai-investigate")
 
         assert result is action
 
-    def test_unknown_label_raises(self):
-        router = LabelRouter()
-
-        with pytest.raises(UnknownLabelError):
-            router.get_action("unknown-label")
-
     def test_register_multiple_labels(self):
         router = LabelRouter()
         investigate = MockAction()
@@ -45,16 +39,8 @@ class TestLabelRouter:
         router.register("ai-investigate", investigate)
         router.register("ai-impact", impact)
 
-        assert router.get_action("ai-investigate") is investigate
-        assert router.get_action("ai-impact") is impact
-
-    def test_has_action(self):
-        router = LabelRouter()
-        action = MockAction()
-        router.register("ai-investigate", action)
-
-        assert router.has_action("ai-investigate") is True
-        assert router.has_action("unknown") is False
+        assert router.find_action("ai-investigate") is investigate
+        assert router.find_action("ai-impact") is impact
 
     def test_action_count(self):
         router = LabelRouter()
@@ -77,6 +63,14 @@ class TestLabelRouter:
         assert len(names) == 2
         assert "MockAction" in names
 
+    def test_find_action(self):
+        router = LabelRouter()
+        action = MockAction()
+        router.register("ai-investigate", action)
+
+        assert router.find_action("ai-investigate") is action
+        assert router.find_action("unknown") is None
+
 
 class TestBaseAction:
     def test_label_property_is_abstract(self):
@@ -0,0 +1,158 @@
+"""Tests for the Jira webhook listener."""
+
+import hashlib
+import hmac
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+from alm_orchestrator.webhook import (
+    SIGNATURE_HEADER,
+    WEBHOOK_PATH,
+    WebhookServer,
+    parse_issue_key,
+    verify_signature,
+)
+
+
+# Each server spends up to half a second in shutdown(); start one per
+# module and reset what it received before every test
+@pytest.fixture(scope="module")
+def _webhook_server():
+    received = []
+    server = WebhookServer(0, received.append, host="127.0.0.1")
+    server.start()
+    yield server, received
+    server.stop()
+
+
+@pytest.fixture(scope="module")
+def _signed_webhook_server():
+    received = []
+    server = WebhookServer(0, received.append, host="127.0.0.1", secret="s3cret")
+    server.start()
+    yield server, received
+    server.stop()
+
+
+@pytest.fixture
+def webhook_server(_webhook_server):
+    _webhook_server[1].clear()
+    return _webhook_server
+
+
+@pytest.fixture
+def signed_webhook_server(_signed_webhook_server):
+    _signed_webhook_server[1].clear()
+    return _signed_webhook_server
+
+
+def sign(secret, body):
+    return "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest()
+
+
+def post(server, path, body, headers=None):
+    request = urllib.request.Request(
+        f"http://127.0.0.1:{server.port}{path}",
+        data=body,
+        headers={"Content-Type": "application/json", **(headers or {})},
+        method="POST",
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+class TestParseIssueKey:
+    def test_issue_updated_event(self):
+        payload = {"webhookEvent": "jira:issue_updated", "issue": {"key": "TEST-123"}}
+
+        assert parse_issue_key(payload) == "TEST-123"
+
+    def test_issue_created_event(self):
+        payload = {"webhookEvent": "jira:issue_created", "issue": {"key": "TEST-7"}}
+
+        assert parse_issue_key(payload) == "TEST-7"
+
+    def test_ignores_other_events(self):
+        payload = {"webhookEvent": "comment_created", "issue": {"key": "TEST-123"}}
+
+        assert parse_issue_key(payload) is None
+
+    def test_ignores_missing_issue(self):
+        assert parse_issue_key({"webhookEvent": "jira:issue_updated"}) is None
+        assert parse_issue_key(["not", "a", "dict"]) is None
+
+
+class TestWebhookServer:
+    def test_post_queues_issue_key(self, webhook_server):
+        server, received = webhook_server
+        body = json.dumps({"webhookEvent": "jira:issue_updated", "issue": {"key": "TEST-123"}})
+
+        status = post(server, WEBHOOK_PATH, body.encode())
+
+        assert status == 202
+        assert received == ["TEST-123"]
+
+    def test_unknown_path_returns_404(self, webhook_server):
+        server, received = webhook_server
+
+        status = post(server, "/other", b"{}")
+
+        assert status == 404
+        assert received == []
+
+    def test_invalid_json_returns_400(self, webhook_server):
+        server, received = webhook_server
+
+        status = post(server, WEBHOOK_PATH, b"not json")
+
+        assert status == 400
+        assert received == []
+
+    def test_signed_request_is_accepted(self, signed_webhook_server):
+        server, received = signed_webhook_server
+        body = json.dumps({"webhookEvent": "jira:issue_updated", "issue": {"key": "TEST-1"}}).encode()
+
+        status = post(server, WEBHOOK_PATH, body, {SIGNATURE_HEADER: sign(b"s3cret", body)})
+
+        assert status == 202
+        assert received == ["TEST-1"]
+
+    def test_bad_signature_returns_401(self, signed_webhook_server):
+        server, received = signed_webhook_server
+        body = json.dumps({"webhookEvent": "jira:issue_updated", "issue": {"key": "TEST-1"}}).encode()
+
+        status = post(server, WEBHOOK_PATH, body, {SIGNATURE_HEADER: sign(b"wrong", body)})
+
+        assert status == 401
+        assert received == []
+
+
+class TestWebhookServerSecret:
+    def test_warns_when_unsigned(self, caplog):
+        server = WebhookServer(0, lambda key: None, host="127.0.0.1")
+        server.stop()
+
+        assert "WEBHOOK_SECRET is not set" in caplog.text
+
+    def test_no_warning_with_secret(self, caplog):
+        server = WebhookServer(0, lambda key: None, host="127.0.0.1", secret="s3cret")
+        server.stop()
+
+        assert "WEBHOOK_SECRET is not set" not in caplog.text
+
+
+class TestVerifySignature:
+    def test_no_secret_accepts_unsigned(self):
+        assert verify_signature(None, b"{}", None) is True
+
+    def test_missing_signature_rejected(self):
+        assert verify_signature(b"s3cret", b"{}", None) is False
+
+    def test_unknown_prefix_rejected(self):
+        digest = sign(b"s3cret", b"{}").removeprefix("sha256=")
+        assert verify_signature(b"s3cret", b"{}", f"sha1={digest}") is False